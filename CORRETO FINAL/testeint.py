@@ -102,9 +102,13 @@ class ModuloBusca:
         self.catalogos_ordenados = []
         self.tomos = []
         self.marcas_corrupcao = []
+        self._indice_fragmentos = None      # modo índice (opt-in): fragmento -> 1ª posição
+        self._indice_origem = (None, 0)
     
     def gerar_fragmentos_aleatorios(self, quantidade=10000):
         self.fragmentos = [f"FRAG-{random.randint(10000, 99999)}" for _ in range(quantidade)]
+        if self._indice_fragmentos is not None:  # modo índice ativo: acompanha a nova lista
+            self._indexar_fragmentos()
         return random.choice(self.fragmentos)
     
     def busca_sequencial(self, alvo):
@@ -115,6 +119,39 @@ class ModuloBusca:
                 return i, comparacoes
         return -1, comparacoes
 
+    def _indexar_fragmentos(self):
+        # percorre de trás para frente: a primeira ocorrência sobrescreve as demais
+        n = len(self.fragmentos)
+        self._indice_fragmentos = dict(zip(reversed(self.fragmentos), range(n - 1, -1, -1)))
+        self._indice_origem = (self.fragmentos, n)
+
+    def invalidar_indices(self):
+        """Descarta o índice de fragmentos; a próxima consulta indexada volta à varredura linear."""
+        self._indice_fragmentos = None
+        self._indice_origem = (None, 0)
+
+    def alterar_fragmento(self, i, fragmento):
+        self.fragmentos[i] = fragmento
+        if self._indice_fragmentos is not None:
+            self.invalidar_indices()
+
+    def busca_sequencial_indexada(self, alvo):
+        """
+        Mesmo resultado de busca_sequencial (índice da primeira ocorrência), servido por
+        um dict fragmento -> posição construído na primeira consulta — O(1) nas seguintes.
+        Retorna (posicao, comparacoes, caminho), caminho em {"linear", "indice"}.
+
+        Contrato: a validade do índice é checada só pela identidade e pelo tamanho da
+        lista. Substitua self.fragmentos (ou use alterar_fragmento) em vez de editá-la
+        no lugar; após qualquer outra mutação in-place chame invalidar_indices().
+        """
+        lista, n = self._indice_origem
+        if self._indice_fragmentos is None or lista is not self.fragmentos or n != len(self.fragmentos):
+            pos, comp = self.busca_sequencial(alvo)
+            self._indexar_fragmentos()
+            return pos, comp, "linear"
+        return self._indice_fragmentos.get(alvo, -1), 1, "indice"
+
     def gerar_catalogos_ordenados(self, n=3, tamanho=10000):
         self.catalogos_ordenados = []
         for _ in range(n):
@@ -591,8 +628,8 @@ class App(tk.Tk):
             self._append_text(self.out_busca, "Gere os fragmentos primeiro.")
             return
         alvo = random.choice(self.modulo.fragmentos)
-        pos, comp = self.modulo.busca_sequencial(alvo)
-        self._append_text(self.out_busca, f"[Sequencial] Alvo={alvo} | pos={pos} | comparações={comp}")
+        pos, comp, caminho = self.modulo.busca_sequencial_indexada(alvo)
+        self._append_text(self.out_busca, f"[Sequencial] Alvo={alvo} | pos={pos} | comparações={comp} | via {caminho}")
 
     def _on_gerar_catalogos(self):
         try:
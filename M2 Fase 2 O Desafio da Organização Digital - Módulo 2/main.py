@@ -1,7 +1,9 @@
 import random
+import re
 import time
 import heapq
-from collections import defaultdict
+from collections import defaultdict, deque
+from itertools import groupby
 
 class ModuloBusca:
     def __init__(self):
@@ -74,6 +76,52 @@ class ModuloBusca:
                     hash_texto += q
         return posicoes, comparacoes
 
+    def _construir_automato(self, padroes):
+        goto = [{}]
+        falha = [0]
+        saida = [[]]
+        for p in padroes:
+            if not p:
+                continue
+            s = 0
+            for c in p:
+                if c not in goto[s]:
+                    goto.append({})
+                    falha.append(0)
+                    saida.append([])
+                    goto[s][c] = len(goto) - 1
+                s = goto[s][c]
+            if p not in saida[s]:
+                saida[s].append(p)
+        fila = deque(goto[0].values())
+        while fila:
+            u = fila.popleft()
+            for c, v in goto[u].items():
+                fila.append(v)
+                f = falha[u]
+                while f and c not in goto[f]:
+                    f = falha[f]
+                falha[v] = goto[f].get(c, 0) if u else 0
+                saida[v] = saida[v] + saida[falha[v]]
+        return goto, falha, saida
+
+    def busca_multipadrao(self, texto, padroes):
+        resultado = {p: [] for p in padroes}
+        if not texto or not any(padroes):
+            return resultado, 0
+        goto, falha, saida = self._construir_automato(padroes)
+        comparacoes = 0
+        s = 0
+        for i, c in enumerate(texto):
+            comparacoes += 1
+            while s and c not in goto[s]:
+                s = falha[s]
+                comparacoes += 1
+            s = goto[s].get(c, 0)
+            for p in saida[s]:
+                resultado[p].append(i - len(p) + 1)
+        return resultado, comparacoes
+
 class ModuloCompactacao:
     def __init__(self):
         self.huffman_codigos = {}
@@ -91,25 +139,121 @@ class ModuloCompactacao:
             heapq.heappush(heap, [menor[0] + maior[0]] + menor[1:] + maior[1:])
         return heap[0]
 
-    def gerar_codigos_huffman(self, no, prefixo=""):
-        if len(no) == 2:
-            char, _ = no
-            self.huffman_codigos[char] = prefixo
-        else:
-            self.gerar_codigos_huffman(no[1], prefixo + '0')
-            self.gerar_codigos_huffman(no[2], prefixo + '1')
-
     def comprimir_huffman(self, dados):
         freq = defaultdict(int)
         for char in dados:
             freq[char] += 1
+        if not freq:
+            return "", {}
         arvore = self.construir_arvore_huffman(freq)
         self.huffman_codigos.clear()
-        self.gerar_codigos_huffman(arvore[1:])
+        for char, codigo in arvore[1:]:
+            self.huffman_codigos[char] = codigo or "0"
         codificado = ''.join(self.huffman_codigos[c] for c in dados)
         return codificado, dict(self.huffman_codigos)
 
-    def descomprimir_huffman(self, codificado, codigos):
+    def empacotar_bits(self, bits):
+        if not bits:
+            return b"", 0
+        pad = -len(bits) % 8
+        return int(bits + "0" * pad, 2).to_bytes((len(bits) + pad) // 8, "big"), pad
+
+    def desempacotar_bits(self, dados, pad):
+        if not dados:
+            return ""
+        bits = bin(int.from_bytes(dados, "big"))[2:].zfill(len(dados) * 8)
+        return bits[:len(bits) - pad]
+
+    def comprimir_huffman_bytes(self, dados):
+        codificado, codigos = self.comprimir_huffman(dados)
+        payload, pad = self.empacotar_bits(codificado)
+        partes = [b"HUF", bytes([1, pad]), len(codigos).to_bytes(4, "big")]
+        for char, codigo in codigos.items():
+            cb = char.encode("utf-8")
+            empacotado, _ = self.empacotar_bits(codigo)
+            partes += [bytes([len(cb)]), cb, len(codigo).to_bytes(2, "big"), empacotado]
+        partes.append(payload)
+        return b"".join(partes)
+
+    def ler_huffman_bytes(self, dados):
+        if dados[:3] != b"HUF" or dados[3] != 1:
+            raise ValueError("Payload Huffman inválido.")
+        pad = dados[4]
+        qtd = int.from_bytes(dados[5:9], "big")
+        i = 9
+        codigos = {}
+        for _ in range(qtd):
+            tam = dados[i]
+            char = dados[i + 1:i + 1 + tam].decode("utf-8")
+            i += 1 + tam
+            bits = int.from_bytes(dados[i:i + 2], "big")
+            i += 2
+            nbytes = (bits + 7) // 8
+            codigos[char] = self.desempacotar_bits(dados[i:i + nbytes], -bits % 8)
+            i += nbytes
+        payload = dados[i:]
+        return payload, len(payload) * 8 - pad, codigos
+
+    def tabelas_decodificacao(self, codigos, k):
+        simples = [None] * (1 << k)
+        for char, codigo in codigos.items():
+            livre = k - len(codigo)
+            base = int(codigo, 2) << livre
+            for j in range(1 << livre):
+                simples[base + j] = (char, len(codigo))
+        mascara = (1 << k) - 1
+        multiplos = [None] * (1 << k)
+        for janela in range(1 << k):
+            chars, usados = [], 0
+            while True:
+                entrada = simples[(janela << usados) & mascara]
+                if entrada is None or usados + entrada[1] > k:
+                    break
+                chars.append(entrada[0])
+                usados += entrada[1]
+            if usados:
+                multiplos[janela] = (''.join(chars), usados)
+        return simples, multiplos
+
+    def descomprimir_huffman(self, codificado, codigos=None):
+        if isinstance(codificado, (bytes, bytearray)):
+            dados, nbits, codigos = self.ler_huffman_bytes(codificado)
+        else:
+            (dados, _), nbits = self.empacotar_bits(codificado), len(codificado)
+        if not nbits or not codigos:
+            return ""
+        maior = max(len(c) for c in codigos.values())
+        if maior > 16 or (1 << maior) > nbits:
+            return self.descomprimir_huffman_bit_a_bit(self.desempacotar_bits(dados, len(dados) * 8 - nbits), codigos)
+        k = max(maior, min(11, (nbits // 4).bit_length()))
+        mascara = (1 << k) - 1
+        simples, multiplos = self.tabelas_decodificacao(codigos, k)
+        resultado = []
+        acc = nacc = 0
+        restante = nbits
+        for byte in dados:
+            acc = (acc << 8) | byte
+            nacc += 8
+            while nacc >= k and restante >= k:
+                entrada = multiplos[(acc >> (nacc - k)) & mascara]
+                if entrada is None:
+                    raise ValueError("Fluxo Huffman inválido.")
+                resultado.append(entrada[0])
+                nacc -= entrada[1]
+                restante -= entrada[1]
+            acc &= (1 << nacc) - 1
+        while restante > 0:
+            janela = (acc >> (nacc - k)) if nacc >= k else (acc << (k - nacc))
+            entrada = simples[janela & mascara]
+            if entrada is None or entrada[1] > restante:
+                raise ValueError("Fluxo Huffman inválido.")
+            resultado.append(entrada[0])
+            nacc -= entrada[1]
+            restante -= entrada[1]
+            acc &= (1 << nacc) - 1
+        return ''.join(resultado)
+
+    def descomprimir_huffman_bit_a_bit(self, codificado, codigos):
         codigos_invertidos = {v: k for k, v in codigos.items()}
         atual = ""
         resultado = []
@@ -121,70 +265,670 @@ class ModuloCompactacao:
         return ''.join(resultado)
 
     def comprimir_rle(self, dados):
-        resultado = ""
-        i = 0
-        while i < len(dados):
-            count = 1
-            while i + 1 < len(dados) and dados[i] == dados[i + 1]:
-                i += 1
-                count += 1
-            resultado += dados[i] + str(count)
-            i += 1
-        return resultado
+        return ''.join(f"{char}{sum(1 for _ in grupo)}" for char, grupo in groupby(dados))
 
     def descomprimir_rle(self, dados):
-        resultado = ""
+        return ''.join(char * int(count) for char, count in re.findall(r'(.)(\d*)', dados, re.S))
+
+    def comprimir_rle_bytes(self, dados):
+        saida = bytearray()
+        literais = bytearray()
+
+        def descarregar_literais():
+            for i in range(0, len(literais), 128):
+                trecho = literais[i:i + 128]
+                saida.append(len(trecho) - 1)
+                saida.extend(trecho)
+            literais.clear()
+
+        for byte, grupo in groupby(dados):
+            n = sum(1 for _ in grupo)
+            while n > 0:
+                k = min(n, 128)
+                if k == 1:
+                    literais.append(byte)
+                else:
+                    descarregar_literais()
+                    saida.append(257 - k)
+                    saida.append(byte)
+                n -= k
+        descarregar_literais()
+        return bytes(saida)
+
+    def descomprimir_rle_bytes(self, dados):
+        saida = bytearray()
         i = 0
         while i < len(dados):
-            char = dados[i]
+            cabecalho = dados[i]
             i += 1
-            count = ""
-            while i < len(dados) and dados[i].isdigit():
-                count += dados[i]
+            if cabecalho < 128:
+                if i + cabecalho + 1 > len(dados):
+                    raise ValueError("RLE truncado.")
+                saida += dados[i:i + cabecalho + 1]
+                i += cabecalho + 1
+            elif cabecalho > 128 and i < len(dados):
+                saida += dados[i:i + 1] * (257 - cabecalho)
                 i += 1
-            resultado += char * int(count)
-        return resultado
+            else:
+                raise ValueError("RLE inválido.")
+        return bytes(saida)
+
+    def bwt(self, dados, tamanho_bloco=1 << 17):
+        saida = bytearray()
+        for inicio in range(0, len(dados), tamanho_bloco):
+            bloco = dados[inicio:inicio + tamanho_bloco]
+            n = len(bloco)
+            rank = list(bloco)
+            rotacoes = list(range(n))
+            k = 1
+            while True:
+                chave = [rank[i] * 257 * n + rank[(i + k) % n] for i in range(n)]
+                rotacoes.sort(key=chave.__getitem__)
+                novo = [0] * n
+                for j in range(1, n):
+                    novo[rotacoes[j]] = novo[rotacoes[j - 1]] + (chave[rotacoes[j]] != chave[rotacoes[j - 1]])
+                rank = novo
+                if rank[rotacoes[-1]] == n - 1 or 2 * k >= n:
+                    break
+                k *= 2
+            primaria = rank[0] if rank[rotacoes[-1]] == n - 1 else rotacoes.index(0)
+            saida += n.to_bytes(4, "big") + primaria.to_bytes(4, "big")
+            saida += bytes(bloco[(i - 1) % n] for i in rotacoes)
+        return bytes(saida)
+
+    def bwt_inversa(self, dados):
+        saida = bytearray()
+        i = 0
+        while i < len(dados):
+            n = int.from_bytes(dados[i:i + 4], "big")
+            primaria = int.from_bytes(dados[i + 4:i + 8], "big")
+            ultima = dados[i + 8:i + 8 + n]
+            i += 8 + n
+            contagem = [0] * 256
+            for c in ultima:
+                contagem[c] += 1
+            inicio_char = [0] * 256
+            total = 0
+            for c in range(256):
+                inicio_char[c] = total
+                total += contagem[c]
+            lf = [0] * n
+            vistos = [0] * 256
+            for j, c in enumerate(ultima):
+                lf[j] = inicio_char[c] + vistos[c]
+                vistos[c] += 1
+            bloco = bytearray(n)
+            j = primaria
+            for pos in range(n - 1, -1, -1):
+                bloco[pos] = ultima[j]
+                j = lf[j]
+            saida += bloco
+        return bytes(saida)
+
+    def mtf(self, dados):
+        alfabeto = list(range(256))
+        saida = bytearray()
+        for c in dados:
+            pos = alfabeto.index(c)
+            saida.append(pos)
+            if pos:
+                del alfabeto[pos]
+                alfabeto.insert(0, c)
+        return bytes(saida)
+
+    def mtf_inversa(self, dados):
+        alfabeto = list(range(256))
+        saida = bytearray()
+        for pos in dados:
+            c = alfabeto[pos]
+            saida.append(c)
+            if pos:
+                del alfabeto[pos]
+                alfabeto.insert(0, c)
+        return bytes(saida)
+
+    def huffman_bytes(self, dados):
+        return self.comprimir_huffman_bytes(dados.decode("latin-1"))
+
+    def huffman_bytes_inversa(self, dados):
+        return self.descomprimir_huffman(dados).encode("latin-1")
+
+    ESTAGIOS = {'bwt': 1, 'mtf': 2, 'rle': 3, 'huffman': 4}
+
+    def estagio(self, nome):
+        return {
+            'bwt': (self.bwt, self.bwt_inversa),
+            'mtf': (self.mtf, self.mtf_inversa),
+            'rle': (self.comprimir_rle_bytes, self.descomprimir_rle_bytes),
+            'huffman': (self.huffman_bytes, self.huffman_bytes_inversa),
+        }[nome]
+
+    def comprimir_pipeline(self, dados, estagios=('bwt', 'mtf', 'rle', 'huffman')):
+        relatorio = [('entrada', len(dados), 0.0)]
+        for nome in estagios:
+            inicio = time.perf_counter()
+            dados = self.estagio(nome)[0](dados)
+            relatorio.append((nome, len(dados), time.perf_counter() - inicio))
+        cabecalho = b"PIPE" + bytes([len(estagios)]) + bytes(self.ESTAGIOS[nome] for nome in estagios)
+        return cabecalho + dados, relatorio
+
+    def descomprimir_pipeline(self, dados):
+        if dados[:4] != b"PIPE":
+            raise ValueError("Pipeline inválido.")
+        qtd = dados[4]
+        nomes = {codigo: nome for nome, codigo in self.ESTAGIOS.items()}
+        estagios = [nomes[c] for c in dados[5:5 + qtd]]
+        dados = dados[5 + qtd:]
+        for nome in reversed(estagios):
+            dados = self.estagio(nome)[1](dados)
+        return dados
+
+MASCARA_64 = (1 << 64) - 1
+
+def rotl64(x, b):
+    return ((x << b) | (x >> (64 - b))) & MASCARA_64
+
+def siphash24(k0, k1, dados):
+    v0 = k0 ^ 0x736f6d6570736575
+    v1 = k1 ^ 0x646f72616e646f6d
+    v2 = k0 ^ 0x6c7967656e657261
+    v3 = k1 ^ 0x7465646279746573
+
+    def rodada(v0, v1, v2, v3):
+        v0 = (v0 + v1) & MASCARA_64
+        v1 = rotl64(v1, 13) ^ v0
+        v0 = rotl64(v0, 32)
+        v2 = (v2 + v3) & MASCARA_64
+        v3 = rotl64(v3, 16) ^ v2
+        v0 = (v0 + v3) & MASCARA_64
+        v3 = rotl64(v3, 21) ^ v0
+        v2 = (v2 + v1) & MASCARA_64
+        v1 = rotl64(v1, 17) ^ v2
+        v2 = rotl64(v2, 32)
+        return v0, v1, v2, v3
+
+    fim = len(dados) - len(dados) % 8
+    for i in range(0, fim, 8):
+        m = int.from_bytes(dados[i:i + 8], 'little')
+        v3 ^= m
+        v0, v1, v2, v3 = rodada(*rodada(v0, v1, v2, v3))
+        v0 ^= m
+    m = int.from_bytes(dados[fim:], 'little') | ((len(dados) & 0xff) << 56)
+    v3 ^= m
+    v0, v1, v2, v3 = rodada(*rodada(v0, v1, v2, v3))
+    v0 ^= m
+    v2 ^= 0xff
+    for _ in range(4):
+        v0, v1, v2, v3 = rodada(v0, v1, v2, v3)
+    return v0 ^ v1 ^ v2 ^ v3
+
+def qui_quadrado(contagens):
+    m = len(contagens)
+    n = sum(contagens)
+    if n == 0 or m < 2:
+        return 0.0, 0.0
+    esperado = n / m
+    chi2 = sum((c - esperado) ** 2 for c in contagens) / esperado
+    z = (chi2 - (m - 1)) / (2 * (m - 1)) ** 0.5
+    return chi2, z
+
+def imprimir_uniformidade(contagens):
+    chi2, z = qui_quadrado(contagens)
+    print(f"Qui-quadrado: {chi2:.1f} com {len(contagens) - 1} graus de liberdade (z = {z:.2f})")
+    print("Distribuição compatível com uniforme." if abs(z) < 3 else "Distribuição NÃO uniforme.")
 
 class ModuloHashing:
-    def __init__(self, tamanho=1009):
+    METODOS = {
+        'extracao': 'hash_extracao',
+        'raiz': 'hash_transformacao_raiz',
+        'fnv1a': 'hash_fnv1a',
+        'fibonacci': 'hash_fibonacci',
+        'siphash': 'hash_siphash',
+    }
+
+    def __init__(self, tamanho=1009, carga_maxima=2.0, buckets_por_passo=4, semente=None):
         self.tamanho = tamanho
-        self.tabela = [[] for _ in range(tamanho)]
+        self.definir_semente(semente)
+        self.tabela = [None] * tamanho      # cada bucket vira lista no primeiro append
+        self.quantidade = 0
+        self.carga_maxima = carga_maxima
+        self.buckets_por_passo = buckets_por_passo
+        self.nova_tabela = None
+        self.novo_tamanho = 0
+        self.pos_rehash = 0
 
-    def hash_extracao(self, chave):
-        return int(chave[-2:]) % self.tamanho
+    def hash_extracao(self, chave, tamanho=None):
+        return int(chave[-2:]) % (tamanho or self.tamanho)
 
-    def hash_transformacao_raiz(self, chave):
+    def hash_transformacao_raiz(self, chave, tamanho=None):
         valor = sum(ord(c) for c in chave)
-        return int((valor ** 0.5) * 100) % self.tamanho
+        return int((valor ** 0.5) * 100) % (tamanho or self.tamanho)
+
+    def hash_fnv1a(self, chave, tamanho=None):
+        h = 0xcbf29ce484222325
+        for b in chave.encode('utf-8'):
+            h = ((h ^ b) * 0x100000001b3) & MASCARA_64
+        return h % (tamanho or self.tamanho)
+
+    def hash_fibonacci(self, chave, tamanho=None):
+        k = 0
+        for b in chave.encode('utf-8'):
+            k = (k * 31 + b) & MASCARA_64
+        k = (k * 0x9e3779b97f4a7c15) & MASCARA_64
+        return (k * (tamanho or self.tamanho)) >> 64
+
+    def definir_semente(self, semente=None):
+        if semente is None:
+            semente = random.getrandbits(128)
+        self.semente = semente
+        self.chave_sip = (semente & MASCARA_64, (semente >> 64) & MASCARA_64)
+
+    def hash_siphash(self, chave, tamanho=None):
+        return siphash24(*self.chave_sip, chave.encode('utf-8')) % (tamanho or self.tamanho)
+
+    def indice(self, chave, metodo='extracao', tamanho=None):
+        return self.funcao_hash(metodo)(chave, tamanho)
+
+    def contagens_por_slot(self):
+        return [len(lista) if lista else 0 for lista in self.tabela]
+
+    def passo_rehash(self):
+        if self.nova_tabela is None:
+            return
+        for _ in range(self.buckets_por_passo):
+            if self.pos_rehash == self.tamanho:
+                self.tabela, self.tamanho = self.nova_tabela, self.novo_tamanho
+                self.nova_tabela = None
+                return
+            for par in self.tabela[self.pos_rehash] or ():
+                anexar(self.nova_tabela, self.indice(par[0], par[2], self.novo_tamanho), par)
+            self.tabela[self.pos_rehash] = None
+            self.pos_rehash += 1
+
+    def iniciar_rehash(self):
+        self.novo_tamanho = proximo_primo(2 * self.tamanho)
+        self.nova_tabela = [None] * self.novo_tamanho
+        self.pos_rehash = 0
+
+    def localizar(self, chave, metodo):
+        h = self.indice(chave, metodo)
+        if self.nova_tabela is not None and h < self.pos_rehash:
+            return self.nova_tabela, self.indice(chave, metodo, self.novo_tamanho)
+        return self.tabela, h
+
+    def bucket(self, chave, metodo):
+        tabela, h = self.localizar(chave, metodo)
+        return tabela[h] or ()
 
     def inserir(self, chave, valor, metodo='extracao'):
-        h = self.hash_extracao(chave) if metodo == 'extracao' else self.hash_transformacao_raiz(chave)
-        for par in self.tabela[h]:
+        self.passo_rehash()
+        tabela, h = self.localizar(chave, metodo)
+        for par in tabela[h] or ():
             if par[0] == chave:
                 par[1] = valor
                 return
-        self.tabela[h].append([chave, valor])
+        anexar(tabela, h, [chave, valor, metodo])
+        self.quantidade += 1
+        if self.nova_tabela is None and self.carga_maxima and self.quantidade > self.carga_maxima * self.tamanho:
+            self.iniciar_rehash()
 
     def buscar(self, chave, metodo='extracao'):
-        h = self.hash_extracao(chave) if metodo == 'extracao' else self.hash_transformacao_raiz(chave)
-        for par in self.tabela[h]:
+        self.passo_rehash()
+        return self.consultar(chave, metodo)
+
+    def consultar(self, chave, metodo='extracao'):
+        for par in self.bucket(chave, metodo):
             if par[0] == chave:
                 return par[1]
         return None
 
+    def remover(self, chave, metodo='extracao'):
+        self.passo_rehash()
+        lista = self.bucket(chave, metodo)
+        for i, par in enumerate(lista):
+            if par[0] == chave:
+                del lista[i]
+                self.quantidade -= 1
+                return True
+        return False
+
+    def redimensionar(self, novo_tamanho):
+        nova = [None] * novo_tamanho
+        for lista in self.tabela + (self.nova_tabela or []):
+            for par in lista or ():
+                anexar(nova, self.indice(par[0], par[2], novo_tamanho), par)
+        self.tabela, self.tamanho = nova, novo_tamanho
+        self.nova_tabela = None
+
+    def funcao_hash(self, metodo):
+        return getattr(self, self.METODOS.get(metodo, 'hash_transformacao_raiz'))
+
+    def inserir_lote(self, pares, metodo='extracao'):
+        pares = list(pares)
+        total = self.quantidade + len(pares)
+        if (self.nova_tabela is None and self.carga_maxima and total > self.carga_maxima * self.tamanho
+                and len(pares) >= self.quantidade):
+            # o lote domina a tabela: redimensionar já custa O(lote) e evita rehashes no meio dele
+            self.redimensionar(proximo_primo(int(total / self.carga_maxima) + 1))
+        funcao = self.funcao_hash(metodo)
+        for chave, valor in pares:
+            tabela, h = self.localizar_lote(chave, funcao)
+            lista = tabela[h]
+            if lista is None:
+                lista = tabela[h] = []
+            for par in lista:
+                if par[0] == chave:
+                    par[1] = valor
+                    break
+            else:
+                lista.append([chave, valor, metodo])
+                self.quantidade += 1
+                if self.nova_tabela is None and self.carga_maxima and self.quantidade > self.carga_maxima * self.tamanho:
+                    self.iniciar_rehash()
+
+    def buscar_lote(self, chaves, metodo='extracao'):
+        funcao = self.funcao_hash(metodo)
+        resultado = []
+        for chave in chaves:
+            tabela, h = self.localizar_lote(chave, funcao)
+            for par in tabela[h] or ():
+                if par[0] == chave:
+                    resultado.append(par[1])
+                    break
+            else:
+                resultado.append(None)
+        return resultado
+
+    def localizar_lote(self, chave, funcao):
+        if self.nova_tabela is None:
+            return self.tabela, funcao(chave, self.tamanho)
+        self.passo_rehash()
+        h = funcao(chave, self.tamanho)
+        if self.nova_tabela is not None and h < self.pos_rehash:
+            return self.nova_tabela, funcao(chave, self.novo_tamanho)
+        return self.tabela, h
+
     def estatisticas_colisoes(self):
-        colisoes = sum(1 for lista in self.tabela if len(lista) > 1)
-        max_lista = max(len(lista) for lista in self.tabela)
+        buckets = self.tabela + (self.nova_tabela or [])
+        colisoes = sum(1 for lista in buckets if lista and len(lista) > 1)
+        max_lista = max(len(lista) if lista else 0 for lista in buckets)
         print(f"Total de slots com colisão: {colisoes}")
         print(f"Comprimento máximo de uma lista encadeada: {max_lista}")
+        if self.nova_tabela is None:
+            imprimir_uniformidade(self.contagens_por_slot())
+
+    def entradas(self):
+        for lista in self.tabela + (self.nova_tabela or []):
+            for chave, _, metodo in lista or ():
+                yield chave, metodo
+
+    def comprimentos_destino(self):
+        if self.nova_tabela is None:
+            return [len(lista) if lista else 0 for lista in self.tabela]
+        # no meio de um rehash mede a tabela de destino: buckets ainda não migrados entram rehasheados
+        comprimentos = [len(lista) if lista else 0 for lista in self.nova_tabela]
+        for lista in self.tabela[self.pos_rehash:]:
+            for chave, _, metodo in lista or ():
+                comprimentos[self.indice(chave, metodo, self.novo_tamanho)] += 1
+        return comprimentos
+
+    def sondagens(self):
+        comprimentos = self.comprimentos_destino()
+        # o histograma sai destes comprimentos: um por slot da tabela de destino
+        assert len(comprimentos) == (self.novo_tamanho if self.nova_tabela is not None else self.tamanho)
+        sucesso = [j for c in comprimentos for j in range(1, c + 1)]
+        fracasso = comprimentos
+        return sucesso, fracasso, comprimentos, comprimentos.count(0) / len(comprimentos)
+
+    def metricas(self, amostras=200):
+        sucesso, fracasso, comprimentos, vazios = self.sondagens()
+        histograma = {}
+        for c in comprimentos:
+            histograma[c] = histograma.get(c, 0) + 1
+        chave_metodo = list(self.entradas())
+        amostra = random.sample(chave_metodo, min(amostras, len(chave_metodo)))
+        lat_sucesso = []
+        lat_fracasso = []
+        for chave, metodo in amostra:
+            inicio = time.perf_counter_ns()
+            self.consultar(chave, metodo)
+            lat_sucesso.append(time.perf_counter_ns() - inicio)
+            ausente = f"AUSENTE-{random.randint(0, 99999):05d}"
+            inicio = time.perf_counter_ns()
+            self.consultar(ausente, metodo)
+            lat_fracasso.append(time.perf_counter_ns() - inicio)
+        tamanho = self.novo_tamanho if self.nova_tabela is not None else self.tamanho
+        return {
+            'tamanho': tamanho,
+            'quantidade': len(sucesso),
+            'carga': len(sucesso) / tamanho,
+            'slots_vazios': vazios,
+            'histograma': dict(sorted(histograma.items())),
+            'sondagem_sucesso_media': sum(sucesso) / len(sucesso) if sucesso else 0.0,
+            'sondagem_sucesso_max': max(sucesso, default=0),
+            'sondagem_fracasso_media': sum(fracasso) / len(fracasso),
+            'sondagem_fracasso_max': max(fracasso),
+            'latencia_busca_ns': resumo_latencias(lat_sucesso),
+            'latencia_busca_ausente_ns': resumo_latencias(lat_fracasso),
+        }
+
+    def copia_vazia(self):
+        return type(self)(tamanho=self.tamanho, carga_maxima=self.carga_maxima,
+                          buckets_por_passo=self.buckets_por_passo, semente=self.semente)
 
     def simular_insercoes(self, n=1000, metodo='extracao'):
+        if isinstance(n, (list, tuple, range)):
+            linhas = []
+            for qtd in n:
+                tabela = self.copia_vazia()
+                linhas.append(tabela.simular_lote(qtd, metodo))
+            imprimir_tabela_metricas(linhas)
+            return linhas
         print(f"\nSimulando {n} inserções com hash '{metodo}'...")
+        pares = [(f"K-{random.randint(10000, 99999)}", f"VAL-{random.randint(10000, 99999)}") for _ in range(n)]
+        self.inserir_lote(pares, metodo)
+        self.estatisticas_colisoes()
+
+    def simular_lote(self, n, metodo):
+        latencias = []
         for _ in range(n):
             chave = f"K-{random.randint(10000, 99999)}"
             valor = f"VAL-{random.randint(10000, 99999)}"
+            inicio = time.perf_counter_ns()
             self.inserir(chave, valor, metodo)
-        self.estatisticas_colisoes()
+            latencias.append(time.perf_counter_ns() - inicio)
+        linha = {'n': n, 'metodo': metodo}
+        linha.update(self.metricas())
+        linha['latencia_insercao_ns'] = resumo_latencias(latencias)
+        return linha
+
+def resumo_latencias(latencias):
+    if not latencias:
+        return {'media': 0.0, 'p50': 0, 'p99': 0, 'max': 0}
+    ordenadas = sorted(latencias)
+    return {
+        'media': sum(ordenadas) / len(ordenadas),
+        'p50': ordenadas[len(ordenadas) // 2],
+        'p99': ordenadas[min(len(ordenadas) - 1, int(len(ordenadas) * 0.99))],
+        'max': ordenadas[-1],
+    }
+
+def imprimir_tabela_metricas(linhas):
+    print(f"{'n':>8} {'método':<10} {'tamanho':>8} {'carga':>6} {'vazios':>7} "
+          f"{'sucesso':>12} {'fracasso':>12} {'ins p99 ns':>11} {'busca p99 ns':>13}")
+    for l in linhas:
+        print(f"{l['n']:>8} {l['metodo']:<10} {l['tamanho']:>8} {l['carga']:>6.2f} {l['slots_vazios']:>7.1%} "
+              f"{l['sondagem_sucesso_media']:>7.2f}/{l['sondagem_sucesso_max']:<4} "
+              f"{l['sondagem_fracasso_media']:>7.2f}/{l['sondagem_fracasso_max']:<4} "
+              f"{l['latencia_insercao_ns']['p99']:>11} {l['latencia_busca_ns']['p99']:>13}")
+
+def anexar(tabela, h, par):
+    lista = tabela[h]
+    if lista is None:
+        tabela[h] = [par]
+    else:
+        lista.append(par)
+
+def proximo_primo(n):
+    n = max(n, 2)
+    while any(n % d == 0 for d in range(2, int(n ** 0.5) + 1)):
+        n += 1
+    return n
+
+class ModuloHashingAberto(ModuloHashing):
+    VAZIO = object()
+    REMOVIDO = object()
+    nova_tabela = None   # sem rehash incremental: redimensiona de uma vez
+
+    def __init__(self, tamanho=1009, carga_maxima=0.7, semente=None):
+        if not 0 < carga_maxima < 1:
+            raise ValueError("Endereçamento aberto exige 0 < carga_maxima < 1.")
+        self.tamanho = tamanho
+        self.carga_maxima = carga_maxima
+        self.definir_semente(semente)
+        self.chaves = [self.VAZIO] * tamanho
+        self.valores = [None] * tamanho
+        self.metodos = [None] * tamanho
+        self.ocupados = 0
+        self.removidos = 0
+
+    def sondar(self, chave, metodo, inicio=None):
+        i = self.indice(chave, metodo) if inicio is None else inicio
+        primeiro_removido = -1
+        for _ in range(self.tamanho):
+            atual = self.chaves[i]
+            if atual is self.VAZIO:
+                return False, (i if primeiro_removido == -1 else primeiro_removido)
+            if atual is self.REMOVIDO:
+                if primeiro_removido == -1:
+                    primeiro_removido = i
+            elif atual == chave:
+                return True, i
+            i = (i + 1) % self.tamanho
+        return False, primeiro_removido
+
+    def redimensionar(self, novo_tamanho):
+        antigos = [(c, v, m) for c, v, m in zip(self.chaves, self.valores, self.metodos)
+                   if c is not self.VAZIO and c is not self.REMOVIDO]
+        self.tamanho = novo_tamanho
+        self.chaves = [self.VAZIO] * novo_tamanho
+        self.valores = [None] * novo_tamanho
+        self.metodos = [None] * novo_tamanho
+        self.ocupados = self.removidos = 0
+        for chave, valor, metodo in antigos:
+            self.inserir(chave, valor, metodo)
+
+    def inserir(self, chave, valor, metodo='extracao'):
+        if (self.ocupados + self.removidos + 1) > self.carga_maxima * self.tamanho:
+            if self.ocupados + 1 > self.carga_maxima * self.tamanho / 2:
+                self.redimensionar(proximo_primo(2 * self.tamanho))
+            else:
+                self.redimensionar(self.tamanho)
+        achou, i = self.sondar(chave, metodo)
+        if not achou:
+            if self.chaves[i] is self.REMOVIDO:
+                self.removidos -= 1
+            self.ocupados += 1
+            self.chaves[i] = chave
+            self.metodos[i] = metodo
+        self.valores[i] = valor
+
+    def buscar(self, chave, metodo='extracao'):
+        achou, i = self.sondar(chave, metodo)
+        return self.valores[i] if achou else None
+
+    consultar = buscar
+
+    def copia_vazia(self):
+        return type(self)(tamanho=self.tamanho, carga_maxima=self.carga_maxima, semente=self.semente)
+
+    def remover(self, chave, metodo='extracao'):
+        achou, i = self.sondar(chave, metodo)
+        if not achou:
+            return False
+        self.chaves[i] = self.REMOVIDO
+        self.valores[i] = self.metodos[i] = None
+        self.ocupados -= 1
+        self.removidos += 1
+        return True
+
+    def inserir_lote(self, pares, metodo='extracao'):
+        pares = list(pares)
+        if self.ocupados + self.removidos + len(pares) > self.carga_maxima * self.tamanho:
+            self.redimensionar(proximo_primo(int((self.ocupados + len(pares)) / self.carga_maxima) + 1))
+        funcao = self.funcao_hash(metodo)
+        for chave, valor in pares:
+            achou, i = self.sondar(chave, metodo, funcao(chave, self.tamanho))
+            if not achou:
+                if self.chaves[i] is self.REMOVIDO:
+                    self.removidos -= 1
+                self.ocupados += 1
+                self.chaves[i] = chave
+                self.metodos[i] = metodo
+            self.valores[i] = valor
+
+    def buscar_lote(self, chaves, metodo='extracao'):
+        # sondagem linear inline: a carga < 1 garante um VAZIO antes de dar a volta na tabela
+        funcao = self.funcao_hash(metodo)
+        tamanho, tabela, valores, vazio = self.tamanho, self.chaves, self.valores, self.VAZIO
+        resultado = []
+        for chave in chaves:
+            i = funcao(chave, tamanho)
+            while True:
+                atual = tabela[i]
+                if atual is vazio:
+                    resultado.append(None)
+                    break
+                if atual == chave:
+                    resultado.append(valores[i])
+                    break
+                i += 1
+                if i == tamanho:
+                    i = 0
+        return resultado
+
+    def estatisticas_colisoes(self):
+        deslocadas = 0
+        max_sondagem = 0
+        for i, chave in enumerate(self.chaves):
+            if chave is self.VAZIO or chave is self.REMOVIDO:
+                continue
+            distancia = (i - self.indice(chave, self.metodos[i])) % self.tamanho
+            if distancia:
+                deslocadas += 1
+            max_sondagem = max(max_sondagem, distancia + 1)
+        print(f"Tamanho da tabela: {self.tamanho} (carga {self.ocupados / self.tamanho:.2f})")
+        print(f"Chaves fora da posição original: {deslocadas}")
+        print(f"Sondagem máxima: {max_sondagem}")
+        imprimir_uniformidade(self.contagens_por_slot())
+
+    def entradas(self):
+        for chave, metodo in zip(self.chaves, self.metodos):
+            if chave is not self.VAZIO and chave is not self.REMOVIDO:
+                yield chave, metodo
+
+    def sondagens(self):
+        sucesso = [(i - self.indice(chave, self.metodos[i])) % self.tamanho + 1
+                   for i, chave in enumerate(self.chaves)
+                   if chave is not self.VAZIO and chave is not self.REMOVIDO]
+        fracasso = [0] * self.tamanho
+        if self.VAZIO in self.chaves:
+            corrida = 0
+            inicio = self.chaves.index(self.VAZIO)
+            for passo in range(self.tamanho):
+                i = (inicio - passo) % self.tamanho
+                corrida = 0 if self.chaves[i] is self.VAZIO else corrida + 1
+                fracasso[i] = corrida + 1
+        else:
+            fracasso = [self.tamanho] * self.tamanho
+        return sucesso, fracasso, sucesso, self.chaves.count(self.VAZIO) / self.tamanho
+
+    def contagens_por_slot(self):
+        contagens = [0] * self.tamanho
+        for chave, metodo in zip(self.chaves, self.metodos):
+            if chave is not self.VAZIO and chave is not self.REMOVIDO:
+                contagens[self.indice(chave, metodo)] += 1
+        return contagens
 
 def cabecalho():
     print("=" * 70)
@@ -198,6 +942,7 @@ def mostrar_complexidade(algoritmo):
         'sequencial': 'O(n)',
         'binaria': 'O(log n)',
         'rabin-karp': 'O(n + m)',
+        'aho-corasick': 'O(n + Σm + z)',
         'huffman': 'O(n log n)',
         'rle': 'O(n)',
         'hash': 'O(1) média / O(n) pior caso'
@@ -251,6 +996,12 @@ if __name__ == "__main__":
                 duracao = time.time() - inicio
                 print(f"Marca '{marca}' encontrada em {len(pos)} posições com {comps} comparações, {duracao:.6f} segundos")
             mostrar_complexidade('rabin-karp')
+            inicio = time.time()
+            ocorrencias, comps = busca.busca_multipadrao(tomos[0], marcas)
+            duracao = time.time() - inicio
+            total = sum(len(pos) for pos in ocorrencias.values())
+            print(f"Aho-Corasick: {len(marcas)} marcas, {total} ocorrências em uma passada com {comps} comparações, {duracao:.6f} segundos")
+            mostrar_complexidade('aho-corasick')
         elif escolha == '5':
             print("\nTeste de Compressão Huffman e RLE")
             texto = input("Digite o texto a ser comprimido: ")
@@ -259,29 +1010,49 @@ if __name__ == "__main__":
             print(f"Tamanho original: {len(texto)}")
             print(f"Tamanho comprimido (bits): {len(huff)}")
             print(f"Huffman descomprimido: {original_huffman}")
+            binario = compactacao.comprimir_huffman_bytes(texto)
+            print(f"Tamanho comprimido (bytes, com tabela): {len(binario)} de {len(texto.encode('utf-8'))}")
+            print(f"Huffman descomprimido (bytes): {compactacao.descomprimir_huffman(binario)}")
             mostrar_complexidade('huffman')
             rle = compactacao.comprimir_rle(texto)
             original_rle = compactacao.descomprimir_rle(rle)
             print(f"RLE comprimido: {rle}")
             print(f"RLE descomprimido: {original_rle}")
+            rle_bytes = compactacao.comprimir_rle_bytes(texto.encode("utf-8"))
+            print(f"RLE binário: {len(rle_bytes)} bytes de {len(texto.encode('utf-8'))}")
+            print(f"RLE binário descomprimido: {compactacao.descomprimir_rle_bytes(rle_bytes).decode('utf-8')}")
             mostrar_complexidade('rle')
+            pacote, relatorio = compactacao.comprimir_pipeline(texto.encode("utf-8"))
+            for nome, tamanho, segundos in relatorio:
+                print(f"  {nome:<8} {tamanho:>10} bytes  {segundos:.6f} s")
+            print(f"Pipeline (BWT+MTF+RLE+Huffman): {len(pacote)} bytes")
+            print(f"Pipeline descomprimido: {compactacao.descomprimir_pipeline(pacote).decode('utf-8')}")
         elif escolha == '6':
             print("\nTeste de Tabela Hash (Extração/Raiz)")
             while True:
-                op = input("[I]nserir, [B]uscar, [S]imular ou [Q]uitar? ").lower()
+                motor = "aberto" if isinstance(hashing, ModuloHashingAberto) else "encadeado"
+                op = input(f"[I]nserir, [B]uscar, [R]emover, [S]imular, [T]rocar motor ({motor}) ou [Q]uitar? ").lower()
                 if op == 'i':
                     chave = input("Chave: ")
                     valor = input("Valor: ")
-                    metodo = input("Método (extracao/raiz): ")
+                    metodo = input("Método (extracao/raiz/fnv1a/fibonacci/siphash): ")
                     hashing.inserir(chave, valor, metodo)
                 elif op == 'b':
                     chave = input("Chave: ")
-                    metodo = input("Método (extracao/raiz): ")
+                    metodo = input("Método (extracao/raiz/fnv1a/fibonacci/siphash): ")
                     val = hashing.buscar(chave, metodo)
                     print(f"Valor encontrado: {val}")
+                elif op == 'r':
+                    chave = input("Chave: ")
+                    metodo = input("Método (extracao/raiz/fnv1a/fibonacci/siphash): ")
+                    print("Removida." if hashing.remover(chave, metodo) else "Chave não encontrada.")
+                elif op == 't':
+                    hashing = ModuloHashing() if motor == "aberto" else ModuloHashingAberto()
+                    print("Tabela nova com motor:", "encadeado" if motor == "aberto" else "aberto")
                 elif op == 's':
-                    metodo = input("Método (extracao/raiz): ")
+                    metodo = input("Método (extracao/raiz/fnv1a/fibonacci/siphash): ")
                     hashing.simular_insercoes(1000, metodo)
+                    hashing.simular_insercoes([100, 1000, 10000], metodo)
                     mostrar_complexidade('hash')
                 elif op == 'q':
                     break
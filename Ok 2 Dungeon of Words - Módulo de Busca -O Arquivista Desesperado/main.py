@@ -5,12 +5,27 @@ Etapa 4: Algoritmos Gulosos (Troco, Escalonamento de Intervalos, Mochila Fracion
          + Programação Dinâmica (Distância de Edição)
 """
 
+import hashlib
+import mmap
+import os
 import random
+import re
 import time
+import weakref
 import heapq
+from array import array
+from bisect import bisect_left
 from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, count
+from multiprocessing import shared_memory
 from typing import List, Tuple, Dict, Any
 
+try:  # opcional: acelera buscas em lote
+    import numpy as np
+except ImportError:
+    np = None
+
 # =========================================
 #        Utilidades / Stubs necessários
 # =========================================
@@ -63,9 +78,86 @@ class CompactadorHuffman:
         codificado = "".join(tabela[c] for c in texto)
         return codificado, tabela
 
-    def descomprimir(self, bits: str, tabela: Dict[str, str]):
-        if not bits or not tabela:
+    def descomprimir(self, bits, tabela: Dict[str, str] = None):
+        """Aceita a string de '0'/'1' + tabela, ou o payload binário de comprimir_bytes."""
+        if isinstance(bits, (bytes, bytearray)):
+            dados, nbits, tabela = self._desserializar(bits)
+        else:
+            if not bits or not tabela:
+                return ""
+            (dados, _), nbits = self._empacotar_bits(bits), len(bits)
+        if not nbits or not tabela:
             return ""
+        return self._decodificar_tabela(dados, nbits, tabela)
+
+    # ---------- decodificação por tabela ----------
+    _MAX_JANELA = 16    # bits indexando a tabela (2^16 entradas no máximo)
+
+    @staticmethod
+    def _tabelas_decodificacao(tabela: Dict[str, str], k: int):
+        """
+        simples[janela]    = (símbolo, tamanho) do código no topo dos k bits;
+        multiplos[janela]  = (símbolos, bits usados) — todos os códigos inteiros que cabem nos k bits.
+        """
+        simples = [None] * (1 << k)
+        for ch, cod in tabela.items():
+            livre = k - len(cod)
+            base = int(cod, 2) << livre
+            for j in range(1 << livre):
+                simples[base + j] = (ch, len(cod))
+        mascara = (1 << k) - 1
+        multiplos = [None] * (1 << k)
+        for janela in range(1 << k):
+            simbolos, usados = [], 0
+            while True:
+                entrada = simples[(janela << usados) & mascara]
+                if entrada is None or usados + entrada[1] > k:
+                    break
+                simbolos.append(entrada[0])
+                usados += entrada[1]
+            if usados:
+                multiplos[janela] = ("".join(simbolos), usados)
+        return simples, multiplos
+
+    def _decodificar_tabela(self, dados: bytes, nbits: int, tabela: Dict[str, str]) -> str:
+        """Lê k bits por vez e emite um ou mais símbolos por consulta à tabela."""
+        maior = max(len(c) for c in tabela.values())
+        # árvore muito funda, ou payload menor que a própria tabela: montar a tabela não compensa
+        if maior > self._MAX_JANELA or (1 << maior) > nbits:
+            return self._decodificar_lento(self._desempacotar_bits(dados, len(dados) * 8 - nbits), tabela)
+        # janela de até 11 bits, mas sem passar de ~nbits/4 entradas (mensagens curtas)
+        k = min(self._MAX_JANELA, max(maior, min(11, (nbits // 4).bit_length())))
+        mascara = (1 << k) - 1
+        simples, multiplos = self._tabelas_decodificacao(tabela, k)
+
+        out = []
+        acc = nacc = 0      # acumulador de bits ainda não decodificados
+        restante = nbits    # bits válidos (sem o preenchimento) ainda não decodificados
+        for byte in dados:
+            acc = (acc << 8) | byte
+            nacc += 8
+            while nacc >= k and restante >= k:
+                entrada = multiplos[(acc >> (nacc - k)) & mascara]
+                if entrada is None:
+                    raise ValueError("Fluxo Huffman inválido.")
+                out.append(entrada[0])
+                nacc -= entrada[1]
+                restante -= entrada[1]
+            acc &= (1 << nacc) - 1
+        # cauda (< k bits válidos): um símbolo por vez, completando a janela com zeros
+        while restante > 0:
+            janela = (acc >> (nacc - k)) if nacc >= k else (acc << (k - nacc))
+            entrada = simples[janela & mascara]
+            if entrada is None or entrada[1] > restante:
+                raise ValueError("Fluxo Huffman inválido.")
+            out.append(entrada[0])
+            nacc -= entrada[1]
+            restante -= entrada[1]
+            acc &= (1 << nacc) - 1
+        return "".join(out)
+
+    @staticmethod
+    def _decodificar_lento(bits: str, tabela: Dict[str, str]) -> str:
         inv = {v: k for k, v in tabela.items()}
         out, buf = [], ""
         for b in bits:
@@ -75,25 +167,497 @@ class CompactadorHuffman:
                 buf = ""
         return "".join(out)
 
+    # ---------- formato binário ----------
+    # MAGICO | versão (1B) | bits de preenchimento (1B) | nº símbolos (4B) | tabela | payload
+    # tabela v1: por símbolo -> tam. UTF-8 (1B), símbolo, tam. do código (2B), código empacotado
+    _MAGICO = b"HUF"
+
+    @staticmethod
+    def _empacotar_bits(bits: str) -> Tuple[bytes, int]:
+        """'0'/'1' -> bytes (big-endian, completado com zeros); retorna (bytes, preenchimento)."""
+        if not bits:
+            return b"", 0
+        pad = -len(bits) % 8
+        return int(bits + "0" * pad, 2).to_bytes((len(bits) + pad) // 8, "big"), pad
+
+    @staticmethod
+    def _desempacotar_bits(dados: bytes, pad: int) -> str:
+        if not dados:
+            return ""
+        bits = bin(int.from_bytes(dados, "big"))[2:].zfill(len(dados) * 8)
+        return bits[:len(bits) - pad]
+
+    # ---------- Huffman canônico com comprimento limitado ----------
+    @staticmethod
+    def _comprimentos_limitados(freq: Dict[str, int], max_bits: int) -> Dict[str, int]:
+        """
+        Package-merge: comprimentos ótimos de código com nenhum acima de max_bits.
+        Cada item é (peso, símbolos); o comprimento de um símbolo é quantas vezes
+        ele aparece nos 2n-2 itens mais leves da última lista.
+        """
+        simbolos = sorted(freq, key=lambda ch: (freq[ch], ch))
+        n = len(simbolos)
+        if n == 1:
+            return {simbolos[0]: 1}
+        max_bits = max(max_bits, (n - 1).bit_length())  # 2^max_bits >= n
+        folhas = [(freq[ch], (ch,)) for ch in simbolos]
+        lista = folhas
+        for _ in range(max_bits - 1):
+            pacotes = [(lista[i][0] + lista[i+1][0], lista[i][1] + lista[i+1][1])
+                       for i in range(0, len(lista) - 1, 2)]
+            lista = list(heapq.merge(folhas, pacotes, key=lambda item: item[0]))
+        comprimentos = dict.fromkeys(simbolos, 0)
+        for _, grupo in lista[:2 * n - 2]:
+            for ch in grupo:
+                comprimentos[ch] += 1
+        return comprimentos
+
+    @staticmethod
+    def _codigos_canonicos(comprimentos: Dict[str, int]) -> Dict[str, str]:
+        """Códigos canônicos: ordena por (comprimento, símbolo) e numera em sequência."""
+        tabela = {}
+        codigo, anterior = 0, 0
+        for ch in sorted(comprimentos, key=lambda c: (comprimentos[c], c)):
+            tam = comprimentos[ch]
+            codigo <<= tam - anterior
+            tabela[ch] = format(codigo, f"0{tam}b")
+            codigo += 1
+            anterior = tam
+        return tabela
+
+    def tabela_canonica(self, texto: str, max_bits: int = 15) -> Dict[str, str]:
+        freq = defaultdict(int)
+        for c in texto:
+            freq[c] += 1
+        if not freq:
+            return {}
+        return self._codigos_canonicos(self._comprimentos_limitados(freq, max_bits))
+
+    def comprimir_bytes(self, texto: str, canonico: bool = False, max_bits: int = 15) -> bytes:
+        """
+        Como comprimir, mas devolve bytes de verdade: cabeçalho com a tabela + bits empacotados.
+        canonico=True (versão 2) usa códigos canônicos de até max_bits e transmite só
+        os comprimentos — cabeçalho de ~3 bytes por símbolo.
+        """
+        if canonico:
+            tabela = self.tabela_canonica(texto, max_bits)
+            bits = "".join(tabela[c] for c in texto)
+        else:
+            bits, tabela = self.comprimir(texto)
+        payload, pad = self._empacotar_bits(bits)
+        partes = [self._MAGICO, bytes([2 if canonico else 1, pad]), len(tabela).to_bytes(4, "big")]
+        for ch, cod in tabela.items():
+            cb = ch.encode("utf-8")
+            if canonico:
+                partes += [bytes([len(cb)]), cb, bytes([len(cod)])]
+            else:
+                codigo, _ = self._empacotar_bits(cod)
+                partes += [bytes([len(cb)]), cb, len(cod).to_bytes(2, "big"), codigo]
+        partes.append(payload)
+        return b"".join(partes)
+
+    def _desserializar(self, dados: bytes) -> Tuple[bytes, int, Dict[str, str]]:
+        """bytes de comprimir_bytes -> (payload empacotado, nº de bits válidos, tabela)."""
+        if dados[:3] != self._MAGICO or dados[3] not in (1, 2):
+            raise ValueError("Payload Huffman inválido.")
+        canonico = dados[3] == 2
+        pad = dados[4]
+        qtd = int.from_bytes(dados[5:9], "big")
+        i = 9
+        tabela = {}
+        comprimentos = {}
+        for _ in range(qtd):
+            tam = dados[i]
+            ch = dados[i+1:i+1+tam].decode("utf-8")
+            i += 1 + tam
+            if canonico:
+                comprimentos[ch] = dados[i]
+                i += 1
+                continue
+            bits = int.from_bytes(dados[i:i+2], "big")
+            i += 2
+            nbytes = (bits + 7) // 8
+            tabela[ch] = self._desempacotar_bits(dados[i:i+nbytes], -bits % 8)
+            i += nbytes
+        if canonico:
+            tabela = self._codigos_canonicos(comprimentos)
+        payload = dados[i:]
+        return payload, len(payload) * 8 - pad, tabela
+
+    # ---------- fluxo em blocos (arquivos grandes) ----------
+    # _MAGICO_FLUXO | (tamanho do bloco em bytes (4B) | bloco canônico de comprimir_bytes)*
+    _MAGICO_FLUXO = b"HUFS"
+
+    def comprimir_stream(self, fonte, destino, tamanho_bloco: int = 1 << 20, max_bits: int = 15):
+        """
+        Comprime um arquivo de texto aberto (`fonte.read(n)` -> str) em `destino` (binário),
+        bloco a bloco, cada um com sua própria tabela canônica. A memória fica limitada
+        ao bloco atual. Retorna (caracteres lidos, bytes escritos).
+        """
+        destino.write(self._MAGICO_FLUXO)
+        lidos, escritos = 0, len(self._MAGICO_FLUXO)
+        while True:
+            bloco = fonte.read(tamanho_bloco)
+            if not bloco:
+                break
+            dados = self.comprimir_bytes(bloco, canonico=True, max_bits=max_bits)
+            destino.write(len(dados).to_bytes(4, "big"))
+            destino.write(dados)
+            lidos += len(bloco)
+            escritos += 4 + len(dados)
+        return lidos, escritos
+
+    def descomprimir_stream(self, fonte, destino):
+        """Inverso de comprimir_stream: lê blocos de `fonte` (binário) e escreve o texto em `destino`."""
+        if fonte.read(len(self._MAGICO_FLUXO)) != self._MAGICO_FLUXO:
+            raise ValueError("Fluxo Huffman inválido.")
+        escritos = 0
+        while True:
+            cabecalho = fonte.read(4)
+            if not cabecalho:
+                break
+            tam = int.from_bytes(cabecalho, "big")
+            dados = fonte.read(tam)
+            if len(cabecalho) < 4 or len(dados) < tam:
+                raise ValueError("Fluxo Huffman truncado.")
+            texto = self.descomprimir(dados)
+            destino.write(texto)
+            escritos += len(texto)
+        return escritos
+
+    # ---------- contêiner em blocos paralelos ----------
+    # _MAGICO_PARALELO | nº blocos (4B) | offsets (8B cada, nº blocos + 1) | blocos canônicos
+    _MAGICO_PARALELO = b"HUFP"
+
+    def comprimir_paralelo(self, dados: str, workers: int = 4, tamanho_bloco: int = 1 << 20,
+                           max_bits: int = 15) -> bytes:
+        """
+        Divide o texto em blocos independentes e comprime cada um (tabela canônica própria)
+        num pool de processos. O índice de offsets no cabeçalho permite descomprimir em
+        paralelo ou acessar um bloco isolado (descomprimir_bloco).
+        """
+        blocos = [dados[i:i+tamanho_bloco] for i in range(0, len(dados), tamanho_bloco)]
+        if workers <= 1 or len(blocos) <= 1:
+            comprimidos = [self.comprimir_bytes(b, canonico=True, max_bits=max_bits) for b in blocos]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                comprimidos = list(pool.map(_comprimir_bloco_huffman, blocos, [max_bits] * len(blocos)))
+        inicio = len(self._MAGICO_PARALELO) + 4 + 8 * (len(comprimidos) + 1)
+        offsets = [inicio]
+        for c in comprimidos:
+            offsets.append(offsets[-1] + len(c))
+        partes = [self._MAGICO_PARALELO, len(comprimidos).to_bytes(4, "big")]
+        partes += [o.to_bytes(8, "big") for o in offsets]
+        return b"".join(partes + comprimidos)
+
+    def _offsets_paralelo(self, container: bytes) -> List[int]:
+        if container[:4] != self._MAGICO_PARALELO:
+            raise ValueError("Contêiner Huffman inválido.")
+        qtd = int.from_bytes(container[4:8], "big")
+        return [int.from_bytes(container[8+8*i:16+8*i], "big") for i in range(qtd + 1)]
+
+    def descomprimir_bloco(self, container: bytes, indice: int) -> str:
+        """Acesso aleatório: descomprime só o bloco `indice` do contêiner."""
+        offsets = self._offsets_paralelo(container)
+        return self.descomprimir(container[offsets[indice]:offsets[indice+1]])
+
+    def descomprimir_paralelo(self, container: bytes, workers: int = 4) -> str:
+        offsets = self._offsets_paralelo(container)
+        blocos = [container[a:b] for a, b in zip(offsets, offsets[1:])]
+        if workers <= 1 or len(blocos) <= 1:
+            return "".join(self.descomprimir(b) for b in blocos)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return "".join(pool.map(_descomprimir_bloco_huffman, blocos))
+
+def _comprimir_bloco_huffman(bloco: str, max_bits: int) -> bytes:
+    """Worker de comprimir_paralelo (precisa ser de módulo para ir ao pool)."""
+    return CompactadorHuffman().comprimir_bytes(bloco, canonico=True, max_bits=max_bits)
+
+def _descomprimir_bloco_huffman(bloco: bytes) -> str:
+    return CompactadorHuffman().descomprimir(bloco)
+
+class DicionarioDAWG:
+    """
+    Grafo acíclico mínimo de palavras (DAWG) em vetores planos.
+    Construção incremental de Daciuk sobre as palavras ordenadas; depois do
+    achatamento, nó v tem arestas [inicio[v], inicio[v+1]) em `rotulos`/`destinos`
+    (ordenadas por rótulo) e final[v] indica fim de palavra.
+    """
+    def __init__(self, palavras):
+        filhos, final = [{}], [False]
+        registro = {}
+        pendentes = []          # (pai, char, filho) ainda não minimizados
+        anterior = ""
+
+        def minimizar(ate):
+            while len(pendentes) > ate:
+                pai, c, filho = pendentes.pop()
+                assinatura = (final[filho], tuple(sorted(filhos[filho].items())))
+                if assinatura in registro:
+                    filhos[pai][c] = registro[assinatura]
+                else:
+                    registro[assinatura] = filho
+
+        for w in sorted(set(palavras)):
+            p = 0
+            while p < len(w) and p < len(anterior) and w[p] == anterior[p]:
+                p += 1
+            minimizar(p)
+            no = pendentes[-1][2] if pendentes else 0
+            for c in w[p:]:
+                novo = len(filhos)
+                filhos.append({}); final.append(False)
+                filhos[no][c] = novo
+                pendentes.append((no, c, novo))
+                no = novo
+            final[no] = True
+            anterior = w
+        minimizar(0)
+
+        # achatamento: renumera só os nós alcançáveis a partir da raiz
+        ids = {0: 0}
+        ordem = [0]
+        for v in ordem:
+            for c, u in sorted(filhos[v].items()):
+                if u not in ids:
+                    ids[u] = len(ordem)
+                    ordem.append(u)
+        self.inicio = array('I', [0])
+        self.rotulos = array('I')
+        self.destinos = array('I')
+        self.final = bytearray(len(ordem))
+        for novo, v in enumerate(ordem):
+            self.final[novo] = final[v]
+            for c, u in sorted(filhos[v].items()):
+                self.rotulos.append(ord(c))
+                self.destinos.append(ids[u])
+            self.inicio.append(len(self.rotulos))
+
+    def _caminhar(self, texto):
+        """Nó alcançado ao consumir `texto` a partir da raiz, ou -1."""
+        v = 0
+        for c in texto:
+            lo, hi = self.inicio[v], self.inicio[v+1]
+            k = bisect_left(self.rotulos, ord(c), lo, hi)
+            if k == hi or self.rotulos[k] != ord(c):
+                return -1
+            v = self.destinos[k]
+        return v
+
+    def validar(self, palavra: str) -> bool:
+        v = self._caminhar(palavra)
+        return v != -1 and bool(self.final[v])
+
+    def tem_prefixo(self, prefixo: str) -> bool:
+        return self._caminhar(prefixo) != -1
+
+    def listar_com_prefixo(self, prefixo: str, limite=None) -> List[str]:
+        """Palavras começando com `prefixo`, em ordem alfabética (no máximo `limite`)."""
+        v = self._caminhar(prefixo)
+        saida = []
+        if v == -1:
+            return saida
+        pilha = [(v, prefixo)]
+        while pilha and (limite is None or len(saida) < limite):
+            v, w = pilha.pop()
+            if self.final[v]:
+                saida.append(w)
+            # empilha ao contrário para visitar em ordem crescente de rótulo
+            for k in range(self.inicio[v+1] - 1, self.inicio[v] - 1, -1):
+                pilha.append((self.destinos[k], w + chr(self.rotulos[k])))
+        return saida
+
 class ValidadorPalavras:
     """Implementação mínima para suportar a opção 6 do menu."""
-    def __init__(self, dicio: List[str]):
-        self._set = set(dicio)
+    def __init__(self, dicio: List[str], compacto: bool = False):
+        # compacto=True guarda só o DAWG (sem o set), com bem menos memória por palavra
+        self._dawg = DicionarioDAWG(dicio) if compacto else None
+        self._set = None if compacto else set(dicio)
+        self._apagados = None   # índice de apagamentos simétricos, construído na primeira sugestão
+        self._mmap = None   # arquivo ordenado mapeado em memória (ver from_file)
     def validar(self, palavra: str) -> bool:
+        if self._mmap is not None:
+            return self._buscar_no_arquivo(palavra.upper().encode("utf-8"))
+        if self._set is None:
+            return self._dawg.validar(palavra.upper())
         return palavra.upper() in self._set
 
+    @classmethod
+    def from_file(cls, caminho: str) -> "ValidadorPalavras":
+        """
+        Dicionário a partir de um arquivo UTF-8 com uma palavra por linha, ORDENADO por bytes
+        (ex.: `LC_ALL=C sort -u`). O arquivo é mapeado com mmap e consultado por busca binária:
+        nada é carregado na inicialização e processos diferentes compartilham o cache de páginas.
+        """
+        val = cls([])
+        val._set = None
+        with open(caminho, "rb") as f:
+            tamanho = os.fstat(f.fileno()).st_size
+            val._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if tamanho else b""
+        return val
+
+    def _buscar_no_arquivo(self, alvo: bytes) -> bool:
+        mm = self._mmap
+        baixo, alto = 0, len(mm)    # ambos sempre no início de uma linha
+        while baixo < alto:
+            meio = (baixo + alto) // 2
+            k = mm.rfind(b"\n", baixo, meio)
+            ini = baixo if k == -1 else k + 1
+            fim = mm.find(b"\n", ini, alto)
+            if fim == -1:
+                fim = alto
+            linha = mm[ini:fim].rstrip(b"\r")
+            if linha == alvo:
+                return True
+            if linha < alvo:
+                baixo = fim + 1
+            else:
+                alto = ini
+        return False
+
+    def _palavras(self):
+        if self._mmap is not None:
+            return [w.rstrip(b"\r").decode("utf-8") for w in self._mmap[:].split(b"\n") if w.rstrip(b"\r")]
+        return self._set if self._set is not None else self._dawg.listar_com_prefixo("")
+
+    # ---------- consultas por prefixo (DAWG) ----------
+    def _dicionario_dawg(self):
+        if self._dawg is None:
+            self._dawg = DicionarioDAWG(self._palavras())
+        return self._dawg
+
+    def tem_prefixo(self, prefixo: str) -> bool:
+        return self._dicionario_dawg().tem_prefixo(prefixo.upper())
+
+    def listar_com_prefixo(self, prefixo: str, limite=None) -> List[str]:
+        return self._dicionario_dawg().listar_com_prefixo(prefixo.upper(), limite)
+
+    # ---------- sugestões por proximidade (índice de apagamentos simétricos) ----------
+    _BITS_ID = 24   # id da palavra nos bits baixos de cada entrada do índice
+
+    @staticmethod
+    def _apagamentos(w: str, k: int) -> set:
+        """Todas as strings obtidas de w apagando até k caracteres (inclui w)."""
+        nivel, todos = {w}, {w}
+        for _ in range(k):
+            nivel = {p[:i] + p[i+1:] for p in nivel for i in range(len(p))}
+            todos |= nivel
+        return todos
+
+    def _construir_apagamentos(self, k: int):
+        """
+        Índice symmetric-delete: cada apagamento (<= k) de cada palavra vira uma entrada
+        (hash do apagamento << 24 | id da palavra) num array('Q') ordenado — ~8 bytes por
+        entrada, sem um dict de strings. A ordenação é feita em 256 baldes (byte alto do
+        hash) para não materializar todas as entradas numa lista de uma vez.
+        """
+        palavras = list(self._palavras())
+        if len(palavras) >= 1 << self._BITS_ID:
+            raise ValueError("Dicionário grande demais para o índice de sugestões.")
+        mascara = (1 << (64 - self._BITS_ID)) - 1
+        baldes = [array('Q') for _ in range(256)]
+        deslocamento = 64 - self._BITS_ID - 8
+        for wid, w in enumerate(palavras):
+            for apagado in self._apagamentos(w, k):
+                h = hash(apagado) & mascara
+                baldes[h >> deslocamento].append((h << self._BITS_ID) | wid)
+        entradas = array('Q')
+        for balde in baldes:
+            entradas.extend(sorted(balde))
+        return palavras, entradas, k
+
+    def sugerir(self, palavra: str, max_dist: int = 2) -> Tuple[List[Tuple[str, int]], int]:
+        """
+        Palavras do dicionário a distância de edição <= max_dist, ordenadas por (distância, palavra).
+        Se dist(a, b) <= k, a e b têm um apagamento comum de <= k caracteres de cada lado: os
+        candidatos saem do índice pelos apagamentos da consulta e só eles têm a distância
+        calculada. Retorna (candidatos, nº de distâncias calculadas).
+        """
+        if max_dist < 0:
+            raise ValueError("Distância máxima deve ser não negativa.")
+        if self._apagados is None or self._apagados[2] < max_dist:
+            self._apagados = self._construir_apagamentos(max_dist)
+        palavras, entradas, _ = self._apagados
+        palavra = palavra.upper()
+        mascara = (1 << (64 - self._BITS_ID)) - 1
+        mascara_id = (1 << self._BITS_ID) - 1
+        ids = set()
+        for apagado in self._apagamentos(palavra, max_dist):
+            h = hash(apagado) & mascara
+            i = bisect_left(entradas, h << self._BITS_ID)
+            while i < len(entradas) and entradas[i] >> self._BITS_ID == h:
+                ids.add(entradas[i] & mascara_id)
+                i += 1
+        candidatos = []
+        for wid in ids:   # colisões de hash e apagamentos distantes caem aqui
+            w = palavras[wid]
+            d = ModuloBusca._levenshtein_limitado(palavra, w, max_dist)
+            if d <= max_dist:
+                candidatos.append((w, d))
+        candidatos.sort(key=lambda x: (x[1], x[0]))
+        return candidatos, len(ids)
+
+class CatalogoCompacto:
+    """
+    Catálogo ordenado de códigos "PREFIXO-nnnnn" guardando só o sufixo numérico em array('I').
+    ~4 bytes por entrada (contra ~60 de uma str) e comparações inteiras na busca binária.
+    Indexação e iteração devolvem o código formatado, como na lista de strings.
+    """
+    def __init__(self, numeros, prefixo="CAT-", largura=5):
+        self.prefixo, self.largura = prefixo, largura
+        self.valores = array('I', sorted(numeros))
+
+    def formatar(self, numero: int) -> str:
+        return f"{self.prefixo}{numero:0{self.largura}d}"
+
+    def chave(self, codigo: str):
+        """Sufixo numérico de `codigo`, ou None se não pertencer a este formato."""
+        sufixo = codigo[len(self.prefixo):]
+        if not codigo.startswith(self.prefixo) or len(sufixo) != self.largura or not sufixo.isdigit():
+            return None
+        return int(sufixo)
+
+    def __len__(self):
+        return len(self.valores)
+
+    def __getitem__(self, i):
+        return self.formatar(self.valores[i])
+
 # =========================================
 #        Implementação dos Algoritmos
 # =========================================
+def _varrer_fatia(nome_shm, inicio, fim, agulha):
+    """Worker de busca_sequencial_paralela: offset (no buffer inteiro) da agulha em [inicio, fim) ou -1."""
+    shm = shared_memory.SharedMemory(name=nome_shm)
+    try:
+        # re varre o memoryview direto, sem copiar a fatia para um bytes
+        achado = re.compile(re.escape(agulha)).search(shm.buf, inicio, fim)
+        p = -1 if achado is None else achado.start()
+        del achado  # o match segura o buffer; precisa sair antes do close()
+    finally:
+        shm.close()
+    return p
+
+def _liberar_shm(shm):
+    shm.close()
+    shm.unlink()
+
 class ModuloBusca:
     def __init__(self):
         self.fragmentos = []
         self.catalogos_ordenados = []
         self.tomos = []
         self.marcas_corrupcao = []
+        self._indice_fragmentos = None      # modo índice (opt-in): fragmento -> 1ª posição
+        self._indice_origem = (None, 0)
+        self._fragmentos_shm = None         # (lista, n, shm, offsets, finalizador) de busca_sequencial_paralela
+        self._tomo_codificado = (None, None)
+        self.indices_sufixos = {}   # índice do tomo -> (suffix array, LCP)
     
     def gerar_fragmentos_aleatorios(self, quantidade=10000):
         self.fragmentos = [f"FRAG-{random.randint(10000, 99999)}" for _ in range(quantidade)]
+        if self._indice_fragmentos is not None:  # modo índice ativo: acompanha a nova lista
+            self._indexar_fragmentos()
         return random.choice(self.fragmentos)
     
     def busca_sequencial(self, alvo):
@@ -104,14 +668,121 @@ class ModuloBusca:
                 return i, comparacoes
         return -1, comparacoes
 
-    def gerar_catalogos_ordenados(self, n=3, tamanho=10000):
+    def _indexar_fragmentos(self):
+        # percorre de trás para frente: a primeira ocorrência sobrescreve as demais
+        n = len(self.fragmentos)
+        self._indice_fragmentos = dict(zip(reversed(self.fragmentos), range(n - 1, -1, -1)))
+        self._indice_origem = (self.fragmentos, n)
+
+    def invalidar_indices(self):
+        """Descarta o índice de fragmentos e o buffer compartilhado da busca paralela."""
+        self._indice_fragmentos = None
+        self._indice_origem = (None, 0)
+        if self._fragmentos_shm is not None:
+            self._fragmentos_shm[4]()   # fecha e remove o bloco compartilhado
+            self._fragmentos_shm = None
+
+    def alterar_fragmento(self, i, fragmento):
+        self.fragmentos[i] = fragmento
+        if self._indice_fragmentos is not None or self._fragmentos_shm is not None:
+            self.invalidar_indices()
+
+    def busca_sequencial_indexada(self, alvo):
+        """
+        Mesmo resultado de busca_sequencial (índice da primeira ocorrência), servido por
+        um dict fragmento -> posição construído na primeira consulta — O(1) nas seguintes.
+        Retorna (posicao, comparacoes, caminho), caminho em {"linear", "indice"}.
+
+        Contrato: a validade do índice é checada só pela identidade e pelo tamanho da
+        lista. Substitua self.fragmentos (ou use alterar_fragmento) em vez de editá-la
+        no lugar; após qualquer outra mutação in-place chame invalidar_indices().
+        """
+        lista, n = self._indice_origem
+        if self._indice_fragmentos is None or lista is not self.fragmentos or n != len(self.fragmentos):
+            pos, comp = self.busca_sequencial(alvo)
+            self._indexar_fragmentos()
+            return pos, comp, "linear"
+        return self._indice_fragmentos.get(alvo, -1), 1, "indice"
+
+    def _buffer_fragmentos(self):
+        """
+        Bloco de memória compartilhada "\n" + "\n".join(fragmentos) + "\n" e os offsets
+        do "\n" que abre cada fragmento. Montado uma vez por lista (mesma regra de
+        validade do índice de busca_sequencial_indexada); None se algum fragmento tem "\n".
+        """
+        cache = self._fragmentos_shm
+        if cache is not None and cache[0] is self.fragmentos and cache[1] == len(self.fragmentos):
+            return cache
+        if cache is not None:
+            cache[4]()
+            self._fragmentos_shm = None
+        texto = "\n" + "\n".join(self.fragmentos) + "\n"
+        if texto.count("\n") != len(self.fragmentos) + 1:
+            return None
+        buf = texto.encode("utf-8")
+        # tamanho em bytes de cada fragmento (= nº de caracteres quando tudo é ASCII), +1 do "\n"
+        tamanhos = map(len, self.fragmentos) if len(buf) == len(texto) else \
+            (len(f.encode("utf-8")) for f in self.fragmentos)
+        offsets = list(accumulate(map((1).__add__, tamanhos), initial=0))
+        shm = shared_memory.SharedMemory(create=True, size=len(buf))
+        shm.buf[:len(buf)] = buf
+        self._fragmentos_shm = (self.fragmentos, len(self.fragmentos), shm, offsets,
+                                weakref.finalize(self, _liberar_shm, shm))
+        return self._fragmentos_shm
+
+    def busca_sequencial_paralela(self, alvo, workers=4, fatias_por_worker=4):
+        """
+        Busca sequencial fatiada entre processos — mesmo contrato (posicao, comparacoes).
+        Os fragmentos vão uma única vez para um bloco de memória compartilhada, reutilizado
+        enquanto a lista não for trocada; cada processo varre só a sua faixa de bytes.
+        Assim que a fatia mais à esquerda com ocorrência é confirmada, as fatias
+        seguintes ainda não iniciadas são canceladas.
+        """
+        n = len(self.fragmentos)
+        if workers <= 1 or n == 0 or "\n" in alvo:
+            return self.busca_sequencial(alvo)
+        cache = self._buffer_fragmentos()
+        if cache is None:  # algum fragmento contém "\n": separador ambíguo
+            return self.busca_sequencial(alvo)
+        _, _, shm, offsets, _ = cache
+        agulha = ("\n" + alvo + "\n").encode("utf-8")
+
+        # fronteiras das fatias sempre caem em um "\n" (início de fragmento)
+        qtd = min(workers * fatias_por_worker, n)
+        cortes = [offsets[n * k // qtd] for k in range(qtd)] + [offsets[n]]
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futuros = [pool.submit(_varrer_fatia, shm.name, cortes[k], cortes[k+1] + 1, agulha)
+                       for k in range(qtd)]
+            achado = -1
+            for k, fut in enumerate(futuros):  # em ordem: a primeira fatia com acerto vence
+                achado = fut.result()
+                if achado != -1:
+                    for resto in futuros[k+1:]:
+                        resto.cancel()
+                    break
+
+        if achado == -1:
+            return -1, n
+        pos = bisect_left(offsets, achado)   # nº de fragmentos antes da ocorrência
+        return pos, pos + 1
+
+    def gerar_catalogos_ordenados(self, n=3, tamanho=10000, compacto=False):
         self.catalogos_ordenados = []
         for _ in range(n):
-            catalogo = sorted([f"CAT-{random.randint(10000, 99999)}" for _ in range(tamanho)])
+            if compacto:
+                catalogo = CatalogoCompacto(random.randint(10000, 99999) for _ in range(tamanho))
+            else:
+                catalogo = sorted([f"CAT-{random.randint(10000, 99999)}" for _ in range(tamanho)])
             self.catalogos_ordenados.append(catalogo)
         return [random.choice(catalogo) for catalogo in self.catalogos_ordenados]
     
     def busca_binaria(self, catalogo, alvo):
+        if isinstance(catalogo, CatalogoCompacto):  # compara inteiros, não strings
+            alvo = catalogo.chave(alvo)
+            if alvo is None:
+                return -1, 0
+            catalogo = catalogo.valores
         baixo, alto = 0, len(catalogo) - 1
         comparacoes = 0
         while baixo <= alto:
@@ -125,8 +796,46 @@ class ModuloBusca:
                 alto = meio - 1
         return -1, comparacoes
 
+    def busca_binaria_lote(self, catalogo, alvos):
+        """
+        Várias buscas binárias em uma chamada. Os alvos são ordenados e varridos em
+        sentido crescente, de modo que cada bisect começa onde o anterior parou.
+        Usa numpy.searchsorted quando o NumPy está disponível.
+        Retorna ([posição de cada alvo na ordem original, -1 se ausente], comparacoes),
+        onde comparacoes soma as sondagens da busca binária (⌈log2⌉ do intervalo).
+        Com repetições no catálogo, a posição é sempre a da primeira ocorrência.
+        """
+        n = len(catalogo)
+        posicoes = [-1] * len(alvos)
+        if n == 0 or not alvos:
+            return posicoes, 0
+        if isinstance(catalogo, CatalogoCompacto):
+            # alvos fora do formato nunca casam: -1 (abaixo de qualquer sufixo válido)
+            alvos = [-1 if k is None else k for k in map(catalogo.chave, alvos)]
+            catalogo = catalogo.valores
+
+        if np is not None:
+            base = np.frombuffer(catalogo, dtype=np.uint32) if isinstance(catalogo, array) else np.asarray(catalogo)
+            achados = np.searchsorted(base, np.asarray(alvos), side="left")
+            comparacoes = len(alvos) * n.bit_length()
+            for k, (p, alvo) in enumerate(zip(achados.tolist(), alvos)):
+                if p < n and catalogo[p] == alvo:
+                    posicoes[k] = p
+            return posicoes, comparacoes
+
+        comparacoes = 0
+        baixo = 0
+        for k in sorted(range(len(alvos)), key=alvos.__getitem__):
+            alvo = alvos[k]
+            comparacoes += (n - baixo).bit_length()
+            baixo = bisect_left(catalogo, alvo, baixo)
+            if baixo < n and catalogo[baixo] == alvo:
+                posicoes[k] = baixo
+        return posicoes, comparacoes
+
     def carregar_tomos_e_marcas(self, tamanho_tomo=100000, qtd_padroes=5):
         self.tomos = [''.join(random.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZ ', k=tamanho_tomo))]
+        self.indices_sufixos = {}
         self.marcas_corrupcao = [
             ''.join(random.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZ', k=random.randint(3, 7)))
             for _ in range(qtd_padroes)
@@ -160,8 +869,239 @@ class ModuloBusca:
                     hash_texto += q
         return posicoes, comparacoes
 
+    # ===== Rabin–Karp rápido (módulo primo de Mersenne) =====
+    @staticmethod
+    def _codificar(texto):
+        """Converte o texto em um buffer de inteiros (bytes quando possível) — sem ord() no laço."""
+        try:
+            return texto.encode('latin-1')
+        except UnicodeEncodeError:
+            return array('I', map(ord, texto))
+
+    def _buffer_tomo(self, texto):
+        # tomos são reutilizados entre consultas: codifica uma única vez
+        if self._tomo_codificado[0] is not texto:
+            self._tomo_codificado = (texto, self._codificar(texto))
+        return self._tomo_codificado[1]
+
+    def busca_rabin_karp_rapida(self, texto, padrao):
+        """
+        Rabin–Karp com módulo primo de Mersenne (2^31-1) sobre o texto pré-codificado.
+        Colisões ficam praticamente nulas; retorna (posicoes, comparacoes, falsos_positivos),
+        onde falsos_positivos conta verificações disparadas por hash igual sem ocorrência real.
+        """
+        n, m = len(texto), len(padrao)
+        if m == 0 or m > n:
+            return [], 0, 0
+        d = 257                 # base prima (evita a estrutura de 2^k mod 2^p-1)
+        q = (1 << 31) - 1
+        buf = self._buffer_tomo(texto)
+        pad = self._codificar(padrao)
+        if type(pad) is not type(buf):
+            if isinstance(buf, bytes):
+                # padrão tem caractere fora do latin-1 e o tomo não: não há ocorrência
+                return [], n - m + 1, 0
+            pad = array('I', iter(pad))  # iter(): converte byte a byte, não reinterpreta a memória
+        h = pow(d, m, q)        # peso do caractere que sai da janela (já deslocado)
+
+        hash_padrao = hash_texto = 0
+        for i in range(m):
+            hash_padrao = (hash_padrao * d + pad[i]) % q
+            hash_texto = (hash_texto * d + buf[i]) % q
+
+        posicoes = []
+        falsos = 0
+        # zip percorre (i, caractere que sai, caractere que entra) sem indexação no laço
+        for i, sai, entra in zip(count(), buf, buf[m:]):
+            if hash_texto == hash_padrao:
+                if buf[i:i+m] == pad:
+                    posicoes.append(i)
+                else:
+                    falsos += 1
+            hash_texto = (hash_texto * d - sai * h + entra) % q
+        if hash_texto == hash_padrao:  # última janela
+            if buf[n-m:] == pad:
+                posicoes.append(n - m)
+            else:
+                falsos += 1
+        return posicoes, n - m + 1, falsos
+
+    # ===== Índice de sufixos (Suffix Array + LCP) persistente =====
+    @staticmethod
+    def _construir_sufixos(texto):
+        """Suffix array por duplicação de prefixos — O(n log² n), poucas rodadas em textos aleatórios."""
+        n = len(texto)
+        sa = list(range(n))
+        if n == 0:
+            return array('i'), array('i')
+        rank = [ord(c) for c in texto]
+        k = 1
+        while True:
+            base = max(rank) + 2
+            chave = [rank[i] * base + (rank[i+k] + 1 if i + k < n else 0) for i in range(n)]
+            sa.sort(key=chave.__getitem__)
+            novo = [0] * n
+            for j in range(1, n):
+                novo[sa[j]] = novo[sa[j-1]] + (chave[sa[j]] != chave[sa[j-1]])
+            rank = novo
+            if rank[sa[-1]] == n - 1 or k >= n:
+                break
+            k <<= 1
+
+        # LCP (Kasai) — lcp[j] = prefixo comum entre sa[j-1] e sa[j]
+        lcp = [0] * n
+        h = 0
+        for i in range(n):
+            r = rank[i]
+            if r == 0:
+                h = 0
+                continue
+            j = sa[r - 1]
+            while i + h < n and j + h < n and texto[i+h] == texto[j+h]:
+                h += 1
+            lcp[r] = h
+            if h:
+                h -= 1
+        return array('i', sa), array('i', lcp)
+
+    _MAGICO_INDICE = b"SAIX1"
+
+    def _salvar_indice(self, caminho, texto, sa, lcp):
+        with open(caminho, "wb") as f:
+            f.write(self._MAGICO_INDICE)
+            f.write(hashlib.sha1(texto.encode("utf-8")).digest())
+            f.write(len(sa).to_bytes(8, "little"))
+            sa.tofile(f)
+            lcp.tofile(f)
+
+    def _carregar_indice(self, caminho, texto):
+        """Retorna (sa, lcp) do disco, ou None se o arquivo não corresponder ao tomo."""
+        try:
+            with open(caminho, "rb") as f:
+                if f.read(len(self._MAGICO_INDICE)) != self._MAGICO_INDICE:
+                    return None
+                if f.read(20) != hashlib.sha1(texto.encode("utf-8")).digest():
+                    return None
+                n = int.from_bytes(f.read(8), "little")
+                sa, lcp = array('i'), array('i')
+                sa.fromfile(f, n)
+                lcp.fromfile(f, n)
+        except (OSError, EOFError):
+            return None
+        return sa, lcp
+
+    def indexar_tomo(self, indice=0, caminho=None):
+        """
+        Constrói (ou reutiliza) o suffix array + LCP do tomo `indice`.
+        Com `caminho`, o índice é lido do disco se ainda corresponder ao tomo;
+        caso contrário é construído e gravado para as próximas execuções.
+        """
+        texto = self.tomos[indice]
+        idx = self._carregar_indice(caminho, texto) if caminho and os.path.exists(caminho) else None
+        if idx is None:
+            idx = self._construir_sufixos(texto)
+            if caminho:
+                self._salvar_indice(caminho, texto, *idx)
+        self.indices_sufixos[indice] = idx
+        return idx
+
+    def busca_sufixos(self, padrao, indice=0):
+        """
+        Todas as ocorrências de `padrao` no tomo via busca binária no suffix array — O(m log n).
+        Retorna (posicoes ordenadas, comparacoes de sufixo).
+        """
+        texto = self.tomos[indice]
+        m = len(padrao)
+        if m == 0 or m > len(texto):
+            return [], 0
+        if indice not in self.indices_sufixos:
+            self.indexar_tomo(indice)
+        sa, _ = self.indices_sufixos[indice]
+        comparacoes = 0
+
+        baixo, alto = 0, len(sa)        # primeiro sufixo com prefixo >= padrao
+        while baixo < alto:
+            meio = (baixo + alto) // 2
+            comparacoes += 1
+            if texto[sa[meio]:sa[meio]+m] < padrao:
+                baixo = meio + 1
+            else:
+                alto = meio
+        inicio = baixo
+        alto = len(sa)                  # primeiro sufixo com prefixo > padrao
+        while baixo < alto:
+            meio = (baixo + alto) // 2
+            comparacoes += 1
+            if texto[sa[meio]:sa[meio]+m] <= padrao:
+                baixo = meio + 1
+            else:
+                alto = meio
+        return sorted(sa[inicio:baixo]), comparacoes
+
+    # ===== Aho–Corasick: várias marcas em uma única passada =====
+    def _construir_automato(self, padroes):
+        """Trie dos padrões + links de falha (BFS). Estados são índices em listas."""
+        goto = [{}]       # estado -> {char: próximo estado}
+        falha = [0]
+        saida = [[]]      # estado -> padrões que terminam aqui (já incluindo os da falha)
+        for p in padroes:
+            if not p:
+                continue
+            s = 0
+            for c in p:
+                if c not in goto[s]:
+                    goto.append({}); falha.append(0); saida.append([])
+                    goto[s][c] = len(goto) - 1
+                s = goto[s][c]
+            if p not in saida[s]:
+                saida[s].append(p)
+
+        fila = deque(goto[0].values())
+        while fila:
+            u = fila.popleft()
+            for c, v in goto[u].items():
+                fila.append(v)
+                f = falha[u]
+                while f and c not in goto[f]:
+                    f = falha[f]
+                falha[v] = goto[f].get(c, 0) if u else 0
+                saida[v] = saida[v] + saida[falha[v]]
+        return goto, falha, saida
+
+    def busca_multipadrao(self, texto, padroes):
+        """
+        Aho–Corasick — O(n + Σm + z), uma única varredura do texto para k padrões.
+        Retorna ({padrao: [posicoes]}, comparacoes), onde comparacoes conta
+        as transições do autômato (uma por caractere + cada link de falha seguido).
+        """
+        resultado = {p: [] for p in padroes}
+        if not texto or not any(padroes):
+            return resultado, 0
+        goto, falha, saida = self._construir_automato(padroes)
+        comparacoes = 0
+        s = 0
+        for i, c in enumerate(texto):
+            comparacoes += 1
+            while s and c not in goto[s]:
+                s = falha[s]
+                comparacoes += 1
+            s = goto[s].get(c, 0)
+            for p in saida[s]:
+                resultado[p].append(i - len(p) + 1)
+        return resultado, comparacoes
+
     # ===== Programação Dinâmica: Distância de Edição (Levenshtein) =====
-    def distancia_edicao(self, s, t):
+    def distancia_edicao(self, s, t, apenas_distancia=False, limite=None):
+        """
+        Retorna (distância, tabela dp). Com apenas_distancia=True usa o algoritmo
+        bit-paralelo de Myers/Hyyrö e devolve (distância, None) sem montar a matriz.
+        Com `limite`=k só interessa saber se a distância é <= k: calcula apenas a faixa
+        diagonal de largura 2k+1 e devolve (k+1, None) quando ela é maior que k.
+        """
+        if limite is not None:
+            return self._levenshtein_limitado(s, t, limite), None
+        if apenas_distancia:
+            return self._levenshtein_bits(s, t), None
         m, n = len(s), len(t)
         dp = [[0]*(n+1) for _ in range(m+1)]
         for i in range(m+1): dp[i][0] = i
@@ -176,6 +1116,71 @@ class ModuloBusca:
                 )
         return dp[m][n], dp
 
+    @staticmethod
+    def _levenshtein_limitado(s, t, k):
+        """PD em faixa |i-j| <= k com duas linhas rolantes; para assim que a linha inteira passa de k."""
+        if k < 0:
+            raise ValueError("Limite deve ser não negativo.")
+        m, n = len(s), len(t)
+        if abs(m - n) > k:
+            return k + 1
+        acima = k + 1               # qualquer valor > k é equivalente
+        ant = [j if j <= k else acima for j in range(n + 1)]
+        atual = [acima] * (n + 1)
+        for i in range(1, m + 1):
+            lo, hi = max(1, i - k), min(n, i + k)
+            atual[lo-1] = i if lo == 1 and i <= k else acima
+            if hi < n:
+                atual[hi+1] = acima  # a próxima linha lê uma casa além da faixa
+            menor = atual[lo-1]
+            c = s[i-1]
+            for j in range(lo, hi + 1):
+                v = ant[j-1] + (c != t[j-1])
+                if ant[j] + 1 < v:
+                    v = ant[j] + 1
+                if atual[j-1] + 1 < v:
+                    v = atual[j-1] + 1
+                if v > acima:
+                    v = acima
+                atual[j] = v
+                if v < menor:
+                    menor = v
+            if menor > k:
+                return acima
+            ant, atual = atual, ant
+        return ant[n]
+
+    @staticmethod
+    def _levenshtein_bits(s, t):
+        """Myers/Hyyrö: cada coluna da PD vira um par de vetores de bits (big-int) — O(⌈m/w⌉·n)."""
+        if len(s) > len(t):
+            s, t = t, s             # o padrão em bits é a string menor
+        m = len(s)
+        if m == 0:
+            return len(t)
+        peq = {}                    # caractere -> máscara das posições em s
+        for i, c in enumerate(s):
+            peq[c] = peq.get(c, 0) | (1 << i)
+        cheio = (1 << m) - 1
+        topo = 1 << (m - 1)
+        pv, mv = cheio, 0           # deltas verticais +1 / -1
+        dist = m
+        for c in t:
+            eq = peq.get(c, 0)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | (~(xh | pv) & cheio)
+            mh = pv & xh
+            if ph & topo:
+                dist += 1
+            elif mh & topo:
+                dist -= 1
+            ph = ((ph << 1) | 1) & cheio
+            mh = (mh << 1) & cheio
+            pv = mh | (~(xv | ph) & cheio)
+            mv = ph & xv
+        return dist
+
 # =========================================
 #        Gulosos (Etapa 4 - Módulo)
 # =========================================
@@ -614,6 +1619,11 @@ if __name__ == "__main__":
             padrao = random.choice(padroes)
             pos, comp = modulo.busca_rabin_karp(texto, padrao)
             print(f"Padrao: {padrao} | Ocorrências: {len(pos)} | Comparações: {comp}")
+            pos, comp, falsos = modulo.busca_rabin_karp_rapida(texto, padrao)
+            print(f"Rabin-Karp (módulo 2^31-1): Ocorrências: {len(pos)} | Falsos positivos: {falsos}")
+            ocorrencias, comp = modulo.busca_multipadrao(texto, padroes)
+            resumo = {p: len(pos) for p, pos in ocorrencias.items()}
+            print(f"Aho-Corasick (todas as marcas, 1 passada): {resumo} | Comparações: {comp}")
            
         elif escolha == '5':
             print("\nTeste de Compressão Huffman")
@@ -623,19 +1633,32 @@ if __name__ == "__main__":
             print("Tabela:", tabela)
             print("Codificado:", cod)
             print("Decodificado:", comp_h.descomprimir(cod, tabela))
+            binario = comp_h.comprimir_bytes(dados)
+            print(f"Binário: {len(binario)} bytes (original: {len(dados.encode('utf-8'))} bytes)"
+                  f" | Decodificado: {comp_h.descomprimir(binario)}")
+            canonico = comp_h.comprimir_bytes(dados, canonico=True)
+            print(f"Canônico: {len(canonico)} bytes | Decodificado: {comp_h.descomprimir(canonico)}")
            
         elif escolha == '6':
             print("\nTeste de Validação de Palavras")
-            dicio = ["FIRE", "ICE", "STONE", "WOOD", "WATER"]
-            val = ValidadorPalavras(dicio)
+            caminho = input("Arquivo de dicionário ordenado (Enter = padrão): ").strip()
+            if caminho and os.path.exists(caminho):
+                val = ValidadorPalavras.from_file(caminho)
+            else:
+                dicio = ["FIRE", "ICE", "STONE", "WOOD", "WATER"]
+                val = ValidadorPalavras(dicio)
             p = input("Palavra para validar: ").strip().upper()
             print("Existe?" , "Sim" if val.validar(p) else "Não")
+            if not val.validar(p):
+                sugestoes, _ = val.sugerir(p, 2)
+                if sugestoes:
+                    print("Você quis dizer:", ", ".join(w for w, _ in sugestoes))
 
         elif escolha == '7':
             print("\nDESAFIO (PD): Distância de Edição (Levenshtein)")
             s = input("Digite a 1ª palavra/frase: ")
             t = input("Digite a 2ª palavra/frase: ")
-            distancia, _ = modulo.distancia_edicao(s, t)
+            distancia, _ = modulo.distancia_edicao(s, t, apenas_distancia=True)
             print(f"\nDistância de edição entre '{s}' e '{t}': {distancia}\n")
 
         elif escolha == '8':
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Dungeon of Words - Benchmark de Compressão
+Compara os codecs dos módulos:
+- CompactadorHuffman (árvore de nós, "CORRETO FINAL/main.py") — modo tabela e canônico
+- ModuloCompactacao (lista/heap, Módulo 2) — Huffman, RLE texto, RLE binário e pipeline
+
+Para cada arquivo do corpus (e/ou texto sintético de tamanhos dados) mede
+MB/s de compressão e descompressão, pico de memória (tracemalloc) e razão
+comprimido/original, e grava um relatório JSON ou CSV.
+
+Execução:
+    python benchmark_compressao.py corpus/*.txt --tamanhos 100000 1000000 --saida relatorio.json
+"""
+
+import argparse
+import csv
+import importlib.util
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+
+def _carregar(nome, caminho):
+    spec = importlib.util.spec_from_file_location(nome, os.path.join(RAIZ, caminho))
+    modulo = importlib.util.module_from_spec(spec)
+    sys.modules[nome] = modulo
+    spec.loader.exec_module(modulo)
+    return modulo
+
+busca = _carregar("dungeon_busca", os.path.join("CORRETO FINAL", "main.py"))
+m2 = _carregar("dungeon_m2", os.path.join("M2 Fase 2 O Desafio da Organização Digital - Módulo 2", "main.py"))
+
+def codecs():
+    """
+    nome -> (comprimir(texto) -> dados, descomprimir(dados) -> texto, tamanho(dados) -> bytes,
+             aceita(texto) -> bool)
+    """
+    huff = busca.CompactadorHuffman()
+    comp = m2.ModuloCompactacao()
+    utf8 = lambda s: len(s.encode("utf-8"))
+    qualquer = lambda t: True
+    sem_digitos = lambda t: not any(c.isdigit() for c in t)  # RLE texto: "a12" é ambíguo
+    return {
+        "huffman-arvore": (huff.comprimir_bytes, huff.descomprimir, len, qualquer),
+        "huffman-canonico": (lambda t: huff.comprimir_bytes(t, canonico=True), huff.descomprimir, len, qualquer),
+        "huffman-lista": (comp.comprimir_huffman_bytes, comp.descomprimir_huffman, len, qualquer),
+        "rle-texto": (comp.comprimir_rle, comp.descomprimir_rle, utf8, sem_digitos),
+        "rle-binario": (lambda t: comp.comprimir_rle_bytes(t.encode("utf-8")),
+                        lambda d: comp.descomprimir_rle_bytes(d).decode("utf-8"), len, qualquer),
+        "pipeline": (lambda t: comp.comprimir_pipeline(t.encode("utf-8"))[0],
+                     lambda d: comp.descomprimir_pipeline(d).decode("utf-8"), len, qualquer),
+    }
+
+def texto_sintetico(tamanho, semente=42):
+    """Texto com distribuição de letras e runs parecida com os tomos do jogo."""
+    rnd = random.Random(semente)
+    palavras = ["FIRE", "ICE", "STONE", "WOOD", "WATER", "DUNGEON", "WORDS", "ARQUIVISTA", "TOMO"]
+    partes, total = [], 0
+    while total < tamanho:
+        p = rnd.choice(palavras) + " " * rnd.randint(1, 3)
+        partes.append(p)
+        total += len(p)
+    return "".join(partes)[:tamanho]
+
+def medir(nome, comprimir, descomprimir, tamanho, texto, repeticoes):
+    original = len(texto.encode("utf-8"))
+    mb = original / 1e6
+    melhor_c = melhor_d = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        dados = comprimir(texto)
+        melhor_c = min(melhor_c, time.perf_counter() - inicio)
+        inicio = time.perf_counter()
+        volta = descomprimir(dados)
+        melhor_d = min(melhor_d, time.perf_counter() - inicio)
+    if volta != texto:
+        raise RuntimeError(f"{nome}: descompressão não reproduz a entrada")
+
+    tracemalloc.start()
+    descomprimir(comprimir(texto))
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "codec": nome,
+        "bytes_originais": original,
+        "bytes_comprimidos": tamanho(dados),
+        "razao": round(tamanho(dados) / original, 4) if original else 0.0,
+        "compressao_mb_s": round(mb / melhor_c, 3) if melhor_c else 0.0,
+        "descompressao_mb_s": round(mb / melhor_d, 3) if melhor_d else 0.0,
+        "pico_memoria_mb": round(pico / 1e6, 3),
+    }
+
+def executar(arquivos, tamanhos, repeticoes, filtro=None):
+    entradas = []
+    for caminho in arquivos:
+        with open(caminho, encoding="utf-8", errors="replace") as f:
+            entradas.append((os.path.basename(caminho), f.read()))
+    for n in tamanhos:
+        entradas.append((f"sintetico-{n}", texto_sintetico(n)))
+
+    resultados = []
+    for corpus, texto in entradas:
+        for nome, (comprimir, descomprimir, tamanho, aceita) in codecs().items():
+            if filtro and nome not in filtro:
+                continue
+            if not aceita(texto):
+                print(f"{corpus:<24} {nome:<18} ignorado (entrada incompatível com o formato)")
+                continue
+            linha = {"corpus": corpus, "versao": "", **medir(nome, comprimir, descomprimir, tamanho, texto, repeticoes)}
+            resultados.append(linha)
+            print(f"{corpus:<24} {nome:<18} razão={linha['razao']:<7} "
+                  f"C={linha['compressao_mb_s']:>8} MB/s  D={linha['descompressao_mb_s']:>8} MB/s  "
+                  f"pico={linha['pico_memoria_mb']} MB")
+    return resultados
+
+def gravar(resultados, caminho, versao):
+    for linha in resultados:
+        linha["versao"] = versao
+    if caminho.endswith(".csv"):
+        with open(caminho, "w", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, fieldnames=list(resultados[0].keys()))
+            w.writeheader()
+            w.writerows(resultados)
+    else:
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(resultados, f, ensure_ascii=False, indent=2)
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Benchmark dos codecs de compressão do Dungeon of Words.")
+    ap.add_argument("arquivos", nargs="*", help="arquivos de texto do corpus")
+    ap.add_argument("--tamanhos", nargs="*", type=int, default=[],
+                    help="tamanhos (caracteres) de texto sintético a incluir")
+    ap.add_argument("--codecs", nargs="*", help="restringe aos codecs informados")
+    ap.add_argument("--repeticoes", type=int, default=3, help="melhor de N execuções (padrão: 3)")
+    ap.add_argument("--saida", default="relatorio_compressao.json", help="relatório .json ou .csv")
+    ap.add_argument("--versao", default="", help="rótulo da versão (ex.: hash do commit) gravado no relatório")
+    args = ap.parse_args()
+
+    if not args.arquivos and not args.tamanhos:
+        args.tamanhos = [100000]
+    resultados = executar(args.arquivos, args.tamanhos, args.repeticoes, args.codecs)
+    if resultados:
+        gravar(resultados, args.saida, args.versao)
+        print(f"\nRelatório gravado em {args.saida}")